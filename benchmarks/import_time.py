@@ -0,0 +1,106 @@
+"""
+Import time of openpyxl_templates, measured with `python -X importtime` in fresh interpreters. Reports the median
+total time of importing each module and the part spent in modules other than openpyxl and its dependencies, which
+is what this package controls. The modules imported only for writing in parallel, streaming and fuzzy header
+matching are listed if they were loaded.
+
+    python benchmarks/import_time.py [--repeat 7] [--output import_time.json] [--max-own-ms 40]
+
+The script exits with status 1 if importing a module loads one of the lazily imported modules, or with
+--max-own-ms if the median own import time of a module exceeds the limit.
+Requires Python 3.7.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+
+MODULES = (
+    "openpyxl_templates",
+    "openpyxl_templates.table_sheet",
+)
+
+# Loaded on first use, importing the package must not load them.
+LAZY_MODULES = (
+    "multiprocessing",
+    "difflib",
+    "future",
+    "openpyxl_templates.parallel",
+    "openpyxl_templates.writer",
+    "openpyxl_templates.aio",
+)
+
+
+def parse_importtime(output):
+    # {module: (self microseconds, cumulative microseconds)}
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def measure(module):
+    code = "import sys, json, %s; print(json.dumps(sorted(sys.modules)))" % module
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, universal_newlines=True
+    )
+    times = parse_importtime(process.stderr)
+    openpyxl = times.get("openpyxl", (0, 0))[1]
+    total = times[module][1] if module in times else sum(self_time for self_time, cumulative in times.values())
+    return dict(
+        total_ms=total / 1000.0,
+        openpyxl_ms=openpyxl / 1000.0,
+        own_ms=(total - openpyxl) / 1000.0,
+        loaded=json.loads(process.stdout.splitlines()[-1]),
+    )
+
+
+def benchmark(modules, repeat):
+    results = []
+    for module in modules:
+        runs = [measure(module) for _ in range(repeat)]
+        loaded = set(runs[-1]["loaded"])
+        results.append(dict(
+            module=module,
+            repeat=repeat,
+            total_ms=median(run["total_ms"] for run in runs),
+            openpyxl_ms=median(run["openpyxl_ms"] for run in runs),
+            own_ms=median(run["own_ms"] for run in runs),
+            eager_lazy_modules=[name for name in LAZY_MODULES if name in loaded],
+        ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--max-own-ms", type=float, help="fail if the own import time of a module exceeds this")
+    args = parser.parse_args()
+
+    results = benchmark(args.modules, args.repeat)
+    for result in results:
+        print("%(module)-35s total %(total_ms)7.1f ms  openpyxl %(openpyxl_ms)7.1f ms  own %(own_ms)6.1f ms" % result)
+        if result["eager_lazy_modules"]:
+            print("    loaded eagerly: %s" % ", ".join(result["eager_lazy_modules"]))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(dict(python=sys.version.split()[0], results=results), f, indent=2)
+
+    failed = [
+        result for result in results
+        if result["eager_lazy_modules"] or (args.max_own_ms is not None and result["own_ms"] > args.max_own_ms)
+    ]
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Rows per second and peak memory of writing and reading a TableSheet, for every column class of
+openpyxl_templates.table_sheet.columns at several row counts and sheet widths. A sheet of `width` columns of the
+same class is written with TableSheet.write and TemplatedWorkbook.save, then loaded with TemplatedWorkbook(file=...)
+and read with TableSheet.read. Each measurement runs in a fresh process, so that the peak RSS is that of the
+measured operation alone.
+
+The results are written as JSON, to stdout or to --output, to be compared between commits:
+
+    python benchmarks/throughput.py --rows 10000 --output before.json
+    python benchmarks/throughput.py --rows 10000 --output after.json
+    python benchmarks/throughput.py --compare before.json after.json
+
+The full grid, the defaults, takes a long while. Limit it with --rows, --widths and --columns.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from tempfile import mkdtemp
+from time import perf_counter
+
+import openpyxl
+
+from openpyxl_templates.table_sheet import TableSheet
+from openpyxl_templates.table_sheet.columns import TableColumn, CharColumn, TextColumn, BoolColumn, FloatColumn, \
+    IntColumn, ChoiceColumn, FortnumChoiceColumn, DatetimeColumn, DateColumn, YearColumn, TimeColumn, \
+    FormulaColumn, EmptyColumn
+from openpyxl_templates.templated_workbook import TemplatedWorkbook
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class Fortnum(Enum):
+    first = 1
+    second = 2
+    third = 3
+
+
+START = datetime(2000, 1, 1, 8, 30)
+
+# Column class name: (create the column, value of the row with the given index)
+COLUMNS = {
+    "TableColumn": (
+        lambda **kwargs: TableColumn(**kwargs),
+        lambda index: "value %d" % index
+    ),
+    "CharColumn": (
+        lambda **kwargs: CharColumn(max_length=32, **kwargs),
+        lambda index: "value %d" % index
+    ),
+    "TextColumn": (
+        lambda **kwargs: TextColumn(**kwargs),
+        lambda index: "text of row %d " % index * 4
+    ),
+    "BoolColumn": (
+        lambda **kwargs: BoolColumn(**kwargs),
+        lambda index: index % 2 == 0
+    ),
+    "FloatColumn": (
+        lambda **kwargs: FloatColumn(**kwargs),
+        lambda index: index * 1.25
+    ),
+    "IntColumn": (
+        lambda **kwargs: IntColumn(**kwargs),
+        lambda index: index
+    ),
+    "ChoiceColumn": (
+        lambda **kwargs: ChoiceColumn(choices=((1, "One"), (2, "Two"), (3, "Three")), **kwargs),
+        lambda index: index % 3 + 1
+    ),
+    "FortnumChoiceColumn": (
+        lambda **kwargs: FortnumChoiceColumn(Fortnum, **kwargs),
+        lambda index: (Fortnum.first, Fortnum.second, Fortnum.third)[index % 3]
+    ),
+    "DatetimeColumn": (
+        lambda **kwargs: DatetimeColumn(**kwargs),
+        lambda index: START + timedelta(minutes=index)
+    ),
+    "DateColumn": (
+        lambda **kwargs: DateColumn(**kwargs),
+        lambda index: START.date() + timedelta(days=index % 10000)
+    ),
+    "YearColumn": (
+        lambda **kwargs: YearColumn(**kwargs),
+        lambda index: date(1900 + index % 200, 1, 1)
+    ),
+    "TimeColumn": (
+        lambda **kwargs: TimeColumn(**kwargs),
+        lambda index: time(index % 24, index % 60)
+    ),
+    "FormulaColumn": (
+        lambda **kwargs: FormulaColumn(formula="=1+1", **kwargs),
+        lambda index: None
+    ),
+    "EmptyColumn": (
+        lambda **kwargs: EmptyColumn(**kwargs),
+        lambda index: None
+    ),
+}
+
+DEFAULT_ROWS = (10000, 100000, 1000000)
+DEFAULT_WIDTHS = (1, 10)
+
+
+def create_workbook(column_name, width, **kwargs):
+    create_column = COLUMNS[column_name][0]
+    sheet = TableSheet(
+        sheetname="benchmark",
+        columns=[
+            create_column(header="%s %d" % (column_name, index), object_attribute="column_%d" % index)
+            for index in range(width)
+        ]
+    )
+    return TemplatedWorkbook(templated_sheets=[sheet], **kwargs), sheet
+
+
+def generate_rows(column_name, width, rows):
+    get_value = COLUMNS[column_name][1]
+    for index in range(rows):
+        value = get_value(index)
+        yield (value,) * width
+
+
+def peak_rss():
+    # Bytes, ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def run_write(column_name, width, rows, filename, write_only):
+    wb, sheet = create_workbook(column_name, width, write_only=write_only)
+
+    start = perf_counter()
+    sheet.write(objects=generate_rows(column_name, width, rows))
+    written = perf_counter()
+    wb.save(filename)
+    saved = perf_counter()
+
+    return dict(
+        write_seconds=written - start,
+        save_seconds=saved - written,
+        seconds=saved - start,
+        file_size=os.path.getsize(filename),
+    )
+
+
+def run_read(column_name, width, rows, filename, read_only):
+    start = perf_counter()
+    wb, sheet = create_workbook(column_name, width, file=filename, read_only=read_only)
+    loaded = perf_counter()
+    count = sum(1 for row in sheet.read())
+    read = perf_counter()
+
+    if count != rows:
+        raise AssertionError("Read %d rows, expected %d." % (count, rows))
+
+    return dict(
+        load_seconds=loaded - start,
+        read_seconds=read - loaded,
+        seconds=read - start,
+    )
+
+
+def run_case(case):
+    run = run_write if case["operation"] == "write" else run_read
+    result = run(case["column"], case["width"], case["rows"], case["filename"], case["streaming"])
+    result["rows_per_second"] = case["rows"] / result["seconds"] if result["seconds"] else None
+    result["peak_rss"] = peak_rss()
+    return result
+
+
+def measure(case):
+    # Run the case in a fresh interpreter, reporting the peak memory of the operation alone.
+    output = subprocess.check_output([sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)])
+    return json.loads(output.decode("utf-8"))
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.STDOUT
+        ).decode("ascii").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark(columns, widths, rows, streaming, log=None):
+    directory = mkdtemp()
+    results = []
+    try:
+        for column_name in columns:
+            for width in widths:
+                for row_count in rows:
+                    filename = os.path.join(directory, "%s_%d_%d.xlsx" % (column_name, width, row_count))
+                    for operation in ("write", "read"):
+                        case = dict(
+                            operation=operation, column=column_name, width=width, rows=row_count,
+                            filename=filename, streaming=streaming
+                        )
+                        result = dict(case, **measure(case))
+                        del result["filename"]
+                        results.append(result)
+                        if log:
+                            log("%(operation)-5s %(column)-20s width %(width)3d rows %(rows)8d: "
+                                "%(rows_per_second)10.0f rows/s %(seconds)8.2f s" % result)
+                    os.remove(filename)
+    finally:
+        for filename in os.listdir(directory):
+            os.remove(os.path.join(directory, filename))
+        os.rmdir(directory)
+
+    return dict(
+        revision=git_revision(),
+        python=platform.python_version(),
+        openpyxl=openpyxl.__version__,
+        platform=platform.platform(),
+        streaming=streaming,
+        results=results,
+    )
+
+
+def compare(before, after):
+    def key(result):
+        return result["operation"], result["column"], result["width"], result["rows"]
+
+    before_results = dict((key(result), result) for result in before["results"])
+    for result in after["results"]:
+        previous = before_results.get(key(result))
+        if not previous or not previous["rows_per_second"] or not result["rows_per_second"]:
+            continue
+        print("%-5s %-20s width %3d rows %8d: %+6.1f%% rows/s %+6.1f%% peak rss" % (
+            key(result) + (
+                (result["rows_per_second"] / previous["rows_per_second"] - 1) * 100,
+                ((result["peak_rss"] or 0) / previous["peak_rss"] - 1) * 100 if previous["peak_rss"] else 0,
+            )
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS)
+    parser.add_argument("--columns", nargs="+", choices=sorted(COLUMNS), default=sorted(COLUMNS))
+    parser.add_argument("--streaming", action="store_true",
+                        help="write in write only mode and read in read only mode")
+    parser.add_argument("--output", help="file to write the JSON results to, stdout if not given")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON results")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        json.dump(run_case(json.loads(args.case)), sys.stdout)
+        return
+
+    if args.compare:
+        with open(args.compare[0]) as before, open(args.compare[1]) as after:
+            compare(json.load(before), json.load(after))
+        return
+
+    def log(message):
+        sys.stderr.write(message + "\n")
+
+    results = benchmark(args.columns, args.widths, args.rows, args.streaming, log=log)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Micro benchmark of reading Typed attributes on TableColumn and TableSheet, comparing the current Typed, which stores
+values on the instance, against the previous implementation backed by a WeakKeyDictionary.
+
+    python benchmarks/typed_access.py
+"""
+from timeit import repeat
+from weakref import WeakKeyDictionary
+
+from openpyxl_templates.table_sheet import TableSheet
+from openpyxl_templates.table_sheet.columns import TableColumn
+from openpyxl_templates.table_sheet.table_sheet import TableSheetExceptionPolicy
+from openpyxl_templates.utils import Typed
+
+
+class WeakKeyTyped(Typed):
+    def __init__(self, *args, **kwargs):
+        super(WeakKeyTyped, self).__init__(*args, **kwargs)
+        self._values = WeakKeyDictionary()
+
+    def __set__(self, instance, value):
+        if instance is None:
+            return
+
+        self.validate(value)
+
+        if value is None:
+            try:
+                del self._values[instance]
+            except KeyError:
+                pass
+            return
+
+        self._values[instance] = value
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            try:
+                return self._values[instance]
+            except KeyError:
+                pass
+        return self.default_value
+
+
+class WeakKeyColumn(TableColumn):
+    allow_blank = WeakKeyTyped("allow_blank", expected_type=bool, value=True)
+    ignore_forced_text = WeakKeyTyped("ignore_forced_text", expected_type=bool, value=True)
+
+
+class WeakKeySheet(TableSheet):
+    exception_policy = WeakKeyTyped(
+        "exception_policy",
+        expected_type=TableSheetExceptionPolicy,
+        value=TableSheetExceptionPolicy.RaiseCellException
+    )
+    look_for_headers = WeakKeyTyped("look_for_headers", expected_type=bool, value=True)
+
+    column = TableColumn()
+
+
+class Sheet(TableSheet):
+    column = TableColumn()
+
+
+def benchmark(statement, obj, number=1000000):
+    return min(repeat(statement, globals={"obj": obj}, number=number, repeat=5)) / number * 1e9
+
+
+if __name__ == "__main__":
+    cases = (
+        (
+            "TableColumn.allow_blank (set)",
+            "obj.allow_blank",
+            TableColumn(allow_blank=False),
+            WeakKeyColumn(allow_blank=False)
+        ),
+        ("TableColumn.allow_blank (default)", "obj.allow_blank", TableColumn(), WeakKeyColumn()),
+        ("TableColumn.ignore_forced_text", "obj.ignore_forced_text", TableColumn(), WeakKeyColumn()),
+        (
+            "TableSheet.exception_policy (set)",
+            "obj.exception_policy",
+            Sheet(exception_policy=TableSheetExceptionPolicy.IgnoreRow),
+            WeakKeySheet(exception_policy=TableSheetExceptionPolicy.IgnoreRow)
+        ),
+        ("TableSheet.look_for_headers (default)", "obj.look_for_headers", Sheet(), WeakKeySheet()),
+    )
+
+    print("%-40s %12s %12s" % ("attribute", "before (ns)", "after (ns)"))
+    for name, statement, after, before in cases:
+        print("%-40s %12.1f %12.1f" % (name, benchmark(statement, before), benchmark(statement, after)))
@@ -0,0 +1,89 @@
+"""
+Compare the rows per second of TableSheet.write_rows using the compiled row encoder against the previous per cell
+implementation, which also added every cell to its data validation and conditional formatting, on the
+ColumnDemoSheet of the demo.
+
+    python benchmarks/write_rows.py [rows]
+"""
+import sys
+from time import perf_counter
+
+from openpyxl.cell import WriteOnlyCell
+
+from openpyxl_templates.demo import DemoWorkbook, demo_objects
+
+
+def legacy_create_cell(column, worksheet, style_set, value, row_type):
+    # TableColumn.create_cell and StyleSet.style_cell as they were, setting the named style of each cell through
+    # Cell.style, which looks it up in the named styles of the workbook.
+    cell = WriteOnlyCell(
+        worksheet,
+        value=column._to_excel(value if value is not None else column.default, row_type=row_type)
+    )
+    cell_style = column.cell_styles[row_type]
+    if cell_style:
+        cell.style = style_set.resolve(cell_style).name
+    return cell
+
+
+def legacy_write_rows(sheet, worksheet, objects):
+    style_set = sheet.template_styles
+    style_set.register(worksheet.parent, sheet.styles)
+
+    sheet._first_data_cell = None
+    cells = None
+    for index, obj in enumerate(objects):
+        row_type = sheet.row_type(obj, index)
+        cells = tuple(
+            legacy_create_cell(
+                column,
+                worksheet,
+                style_set,
+                column.get_value_from_object(obj, row_type=row_type),
+                row_type
+            ) for column in sheet.columns
+        )
+        worksheet.append(cells)
+
+        if not sheet._first_data_cell:
+            sheet._first_data_cell = cells[0]
+
+        for cell, column in zip(cells, sheet.columns):
+            data_validation = column.data_validations[row_type]
+            if data_validation:
+                data_validation.add(cell)
+
+            conditional_formatting = column.conditional_formattings[row_type]
+            if conditional_formatting:
+                worksheet.conditional_formatting.add(cell, conditional_formatting)
+
+    if cells:
+        sheet._last_data_cell = cells[-1]
+
+
+def compiled_write_rows(sheet, worksheet, objects):
+    sheet.write_rows(worksheet, objects)
+
+
+def benchmark(write_rows, objects):
+    sheet = DemoWorkbook().column_demo
+    worksheet = sheet.worksheet
+    sheet.prepare_worksheet(worksheet)
+    sheet.write_headers(worksheet)
+
+    start = perf_counter()
+    write_rows(sheet, worksheet, objects)
+    return len(objects) / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    objects = list(demo_objects(count))
+
+    before = benchmark(legacy_write_rows, objects)
+    after = benchmark(compiled_write_rows, objects)
+
+    print("rows:   %d" % count)
+    print("before: %.0f rows/s" % before)
+    print("after:  %.0f rows/s" % after)
+    print("change: %+.0f%%" % ((after / before - 1) * 100))
@@ -0,0 +1,95 @@
+import asyncio
+from functools import partial
+from itertools import islice
+
+# Requires Python 3.6, the module is only imported by the async methods of the templated sheets and workbooks.
+
+
+async def write(table_sheet, objects, batch_size=1000, executor=None, **kwargs):
+    """
+    Write the objects of the async (or plain) iterable `objects` with `table_sheet.write` in the executor. Batches
+    of `batch_size` objects are pulled from the iterable by the event loop as the writer consumes them, at most
+    one batch ahead of the writer.
+    """
+    loop = asyncio.get_event_loop()
+    batches = _batches(objects, batch_size)
+    pending = []
+
+    def next_batch():
+        pending[:] = [asyncio.run_coroutine_threadsafe(_next_batch(batches), loop)]
+        return pending[0]
+
+    def rows():
+        future = next_batch()
+        while True:
+            batch = future.result()
+            if batch is None:
+                return
+            future = next_batch()
+            for obj in batch:
+                yield obj
+
+    try:
+        await loop.run_in_executor(executor, partial(table_sheet.write, objects=rows(), **kwargs))
+    finally:
+        # Stop fetching ahead when the writer fails.
+        for future in pending:
+            future.cancel()
+
+
+async def read(table_sheet, batch_size=1000, executor=None, **kwargs):
+    """
+    Yield the objects of `table_sheet.read` while reading batches of `batch_size` rows in the executor.
+    """
+    loop = asyncio.get_event_loop()
+    rows = table_sheet.read(**kwargs)
+
+    while True:
+        batch, exception = await loop.run_in_executor(executor, _take, rows, batch_size)
+        for row in batch:
+            yield row
+        if exception is not None:
+            raise exception
+        if len(batch) < batch_size:
+            return
+
+
+async def save(templated_workbook, filename, executor=None):
+    return await asyncio.get_event_loop().run_in_executor(executor, templated_workbook.save, filename)
+
+
+async def _batches(objects, batch_size):
+    if not hasattr(objects, "__aiter__"):
+        objects = iter(objects)
+        while True:
+            batch = list(islice(objects, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    batch = []
+    async for obj in objects:
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _next_batch(batches):
+    try:
+        return await batches.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def _take(rows, batch_size):
+    # Rows read before an exception are returned with it, to be yielded in order before it is raised.
+    batch = []
+    try:
+        for row in islice(rows, batch_size):
+            batch.append(row)
+    except Exception as e:
+        return batch, e
+    return batch, None
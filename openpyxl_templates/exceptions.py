@@ -1,9 +1,18 @@
+def _rebuild_exception(cls, args, state):
+    exception = cls.__new__(cls)
+    exception.args = args
+    exception.__dict__.update(state)
+    return exception
+
+
 class OpenpyxlTemplateException(Exception):
-    pass
+    def __reduce__(self):
+        # Subclasses build their message in __init__, restore pickled exceptions without calling it.
+        return _rebuild_exception, (type(self), self.args, self.__dict__)
 
 
 class CellException(OpenpyxlTemplateException):
-    pass
+    coordinate = None
 
 
 class RowException(OpenpyxlTemplateException):
@@ -11,8 +20,9 @@ class RowException(OpenpyxlTemplateException):
 
 
 class CellExceptions(RowException):
-    def __init__(self, cell_exceptions):
+    def __init__(self, cell_exceptions, row_number=None):
         self.cell_exceptions = cell_exceptions
+        self.row_number = row_number
         super().__init__(
             "Failed to read row due to cell errors: %s" %
             ", ".join("\n    %s: '%s'" % (e.coordinate, str(e)) for e in self.cell_exceptions)
@@ -0,0 +1,248 @@
+import multiprocessing
+import os
+import re
+from collections import namedtuple, deque
+from itertools import islice
+
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.writer.write_only import WriteOnlyWorksheet
+
+from openpyxl_templates.exceptions import CellException, CellExceptions, OpenpyxlTemplateException
+from openpyxl_templates.utils import refresh_print_titles
+
+_STYLE_TABLES = ("_fonts", "_fills", "_borders", "_alignments", "_protections", "_number_formats")
+_CUSTOM_NUMBER_FORMAT_OFFSET = 164
+
+# Cells as serialized by the worksheet writer of openpyxl, with the attributes in the order r, s, t. Each cell of a
+# part must match, _remap_cells raises UnexpectedCellMarkup otherwise rather than leave a cell unmapped.
+_CELL_START = b"<c "
+_CELL_RE = re.compile(
+    br'<c r="(?P<r>[A-Z]+[0-9]+)"(?: s="(?P<s>[0-9]+)")?(?: t="(?P<t>[a-zA-Z]+)")?(?P<end>\s*/?>)'
+    br'(?:<v>(?P<v>[0-9]+)</v>)?'
+)
+_CHUNK_SIZE = 1 << 20
+
+# The jobs of the running parallel write and the reader of the running parallel read. Set in the parent before
+# forking so that the workers inherit the templated sheets, and their iterables, without having to pickle them.
+_jobs = None
+_reader = None
+
+SheetPart = namedtuple(
+    "SheetPart",
+    ("filename", "shared_strings", "cell_styles", "style_tables", "print_settings", "conditional_formatting")
+)
+
+
+class UnexpectedCellMarkup(OpenpyxlTemplateException):
+    def __init__(self, markup):
+        super(UnexpectedCellMarkup, self).__init__(
+            "The cell '%s' written by a worker could not be merged, the worksheet writer of this version of openpyxl "
+            "serializes cells differently than expected." % markup.decode("utf-8", "replace")
+        )
+
+
+class SheetPartWorksheet(WriteOnlyWorksheet):
+    """
+    Write only worksheet whose content has been serialized by a worker process. The part is copied into the
+    package as is when the workbook is saved.
+    """
+
+    def close(self):
+        pass
+
+
+def fork_available():
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def write_sheets(workbook, jobs, processes=None):
+    """
+    Write each (templated_sheet, kwargs) job of a write only workbook in a forked worker process and merge the
+    resulting worksheet parts into the workbook in the order of the jobs.
+    """
+    global _jobs
+
+    if not jobs:
+        return
+
+    # Register every style up front so that all workers share the style tables of the parent.
+    for templated_sheet, kwargs in jobs:
+        templated_sheet.template_styles.register(workbook, templated_sheet.styles)
+
+    base = _TableSizes(workbook)
+
+    _jobs = jobs
+    try:
+        pool = multiprocessing.get_context("fork").Pool(processes=min(processes or os.cpu_count(), len(jobs)))
+        try:
+            parts = pool.map(_write_sheet_part, [(index, base) for index in range(len(jobs))], chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _jobs = None
+
+    for (templated_sheet, kwargs), part in zip(jobs, parts):
+        _merge_sheet_part(workbook, templated_sheet.sheetname, base, part)
+
+
+class _TableSizes(object):
+    def __init__(self, workbook):
+        self.shared_strings = len(workbook.shared_strings)
+        self.cell_styles = len(workbook._cell_styles)
+        self.style_tables = {name: len(getattr(workbook, name)) for name in _STYLE_TABLES}
+
+
+def _write_sheet_part(args):
+    index, base = args
+    templated_sheet, kwargs = _jobs[index]
+    kwargs = dict(kwargs)
+    if callable(kwargs.get("objects")):
+        kwargs["objects"] = kwargs["objects"]()
+
+    templated_sheet.write(**kwargs)
+    worksheet = templated_sheet.worksheet
+    worksheet.close()
+
+    workbook = worksheet.parent
+    return SheetPart(
+        filename=worksheet.filename,
+        shared_strings=list(workbook.shared_strings[base.shared_strings:]),
+        cell_styles=[tuple(style_array) for style_array in workbook._cell_styles[base.cell_styles:]],
+        style_tables={name: list(getattr(workbook, name)[size:]) for name, size in base.style_tables.items()},
+        print_settings={
+            "_print_rows": worksheet._print_rows,
+            "_print_cols": worksheet._print_cols,
+            "_print_area": worksheet._print_area,
+        },
+        # Write only worksheets do not serialize conditional formatting, the parent injects it when saving.
+        conditional_formatting=worksheet.conditional_formatting
+    )
+
+
+def _index_map(size, table, items):
+    return list(range(size)) + [table.add(item) for item in items]
+
+
+def _merge_sheet_part(workbook, title, base, part):
+    string_map = _index_map(base.shared_strings, workbook.shared_strings, part.shared_strings)
+
+    table_maps = {
+        name: _index_map(base.style_tables[name], getattr(workbook, name), part.style_tables[name])
+        for name in _STYLE_TABLES
+    }
+
+    def remap_style_array(values):
+        style_array = StyleArray(values)
+        style_array.fontId = table_maps["_fonts"][style_array.fontId]
+        style_array.fillId = table_maps["_fills"][style_array.fillId]
+        style_array.borderId = table_maps["_borders"][style_array.borderId]
+        style_array.alignmentId = table_maps["_alignments"][style_array.alignmentId]
+        style_array.protectionId = table_maps["_protections"][style_array.protectionId]
+        if style_array.numFmtId >= _CUSTOM_NUMBER_FORMAT_OFFSET:
+            style_array.numFmtId = table_maps["_number_formats"][
+                style_array.numFmtId - _CUSTOM_NUMBER_FORMAT_OFFSET] + _CUSTOM_NUMBER_FORMAT_OFFSET
+        return style_array
+
+    style_map = list(range(base.cell_styles)) + [
+        workbook._cell_styles.add(remap_style_array(values)) for values in part.cell_styles
+    ]
+
+    def remap_cell(match):
+        s, t, v = match.group("s", "t", "v")
+        out = b'<c r="' + match.group("r") + b'"'
+        if s is not None:
+            out += b' s="%d"' % style_map[int(s)]
+        if t is not None:
+            out += b' t="' + t + b'"'
+        out += match.group("end")
+        if v is not None:
+            out += b"<v>" + (b"%d" % string_map[int(v)] if t == b"s" else v) + b"</v>"
+        return out
+
+    worksheet = SheetPartWorksheet(parent=workbook, title=title)
+    # The parts are copied as bytes, they are UTF-8 encoded XML whatever the locale.
+    with open(part.filename, "rb") as src, open(worksheet.filename, "wb") as dst:
+        pending = b""
+        while True:
+            chunk = src.read(_CHUNK_SIZE)
+            pending += chunk
+            # Only rewrite up to the last cell start, the cell may continue in the next chunk.
+            cut = pending.rfind(_CELL_START) if chunk else len(pending)
+            if cut > 0:
+                dst.write(_remap_cells(remap_cell, pending[:cut]))
+                pending = pending[cut:]
+            if not chunk:
+                break
+    os.remove(part.filename)
+
+    for key, value in part.print_settings.items():
+        setattr(worksheet, key, value)
+    # The print titles are computed from the print settings and the title of the worksheet they are set on.
+    refresh_print_titles(worksheet)
+    worksheet.conditional_formatting = part.conditional_formatting
+
+    workbook._add_sheet(worksheet)
+    return worksheet
+
+
+def _remap_cells(remap_cell, data):
+    remapped, count = _CELL_RE.subn(remap_cell, data)
+    if count != data.count(_CELL_START):
+        position = 0
+        while True:
+            position = data.index(_CELL_START, position)
+            if not _CELL_RE.match(data, position):
+                raise UnexpectedCellMarkup(data[position:data.find(b">", position) + 1])
+            position += len(_CELL_START)
+    return remapped
+
+
+def convert_rows(table_sheet, rows, exception_policy, workers=None, chunk_size=1000):
+    """
+    Convert the (row_number, values) pairs of `rows` in chunks in forked worker processes. Yields
+    (row_number, (row, exception)) pairs in the order of `rows`, where exception is the CellException or
+    CellExceptions raised when converting the row.
+    """
+    global _reader
+
+    workers = workers or os.cpu_count()
+    rows = iter(rows)
+
+    # The first chunk is read before forking, locating the columns of the sheet, and the converters compiled for
+    # the workers to share them.
+    chunk = list(islice(rows, chunk_size))
+    _reader = table_sheet.row_converter, exception_policy
+    try:
+        pool = multiprocessing.get_context("fork").Pool(processes=workers)
+    finally:
+        _reader = None
+
+    try:
+        # Only keep a limited number of chunks in flight, the pool would otherwise consume all rows up front.
+        pending = deque()
+        while True:
+            if chunk:
+                pending.append(pool.apply_async(_convert_chunk, (chunk,)))
+            if pending and (not chunk or len(pending) >= 2 * workers):
+                for result in pending.popleft().get():
+                    yield result
+            elif not chunk:
+                break
+            if chunk:
+                chunk = list(islice(rows, chunk_size))
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _convert_chunk(chunk):
+    convert, exception_policy = _reader
+    results = []
+    for row_number, values in chunk:
+        try:
+            results.append((row_number, (convert(values, row_number, exception_policy), None)))
+        except (CellException, CellExceptions) as e:
+            results.append((row_number, (None, e)))
+    return results
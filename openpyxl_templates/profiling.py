@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from timeit import default_timer
+
+
+class Timings(object):
+    """
+    The measurements of one operation on a sheet, or of saving the workbook. `phases` maps each phase to the
+    seconds spent in it and `columns` maps the header of each column to the seconds spent per conversion step:
+    to_excel, style_cell, post_process_cell and from_excel. Style_cell includes creating the cell, to_excel
+    includes styling for columns overriding create_cell.
+    """
+
+    def __init__(self, operation, sheetname=None):
+        self.operation = operation
+        self.sheetname = sheetname
+        self.phases = OrderedDict()
+        self.columns = OrderedDict()
+        self.rows = 0
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase):
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self.add(phase, default_timer() - start)
+
+    def timed(self, phase, function, count_rows=False):
+        """
+        Wrap function to add the time spent calling it to phase, and to count the rows if count_rows.
+        """
+        phases = self.phases
+
+        def timed_function(*args, **kwargs):
+            start = default_timer()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                phases[phase] = phases.get(phase, 0.0) + default_timer() - start
+            if count_rows:
+                self.rows += 1
+            return result
+
+        return timed_function
+
+    def timed_iter(self, phase, iterable):
+        """
+        Iterate iterable adding the time spent producing each item to phase.
+        """
+        phases = self.phases
+        iterator = iter(iterable)
+        while True:
+            start = default_timer()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                phases[phase] = phases.get(phase, 0.0) + default_timer() - start
+            yield item
+
+    def column(self, header):
+        try:
+            return self.columns[header]
+        except KeyError:
+            column = self.columns[header] = ColumnTimings()
+            return column
+
+    @property
+    def seconds(self):
+        return sum(self.phases.values())
+
+    @property
+    def rows_per_second(self):
+        seconds = self.seconds
+        return self.rows / seconds if seconds else None
+
+    def as_dict(self):
+        return OrderedDict((
+            ("operation", self.operation),
+            ("sheetname", self.sheetname),
+            ("rows", self.rows),
+            ("seconds", self.seconds),
+            ("rows_per_second", self.rows_per_second),
+            ("phases", OrderedDict(self.phases)),
+            ("columns", OrderedDict((header, OrderedDict(column)) for header, column in self.columns.items())),
+        ))
+
+    def __repr__(self):
+        return "Timings(%s)" % ", ".join("%s=%r" % item for item in self.as_dict().items())
+
+
+class ColumnTimings(OrderedDict):
+    def add(self, step, seconds):
+        self[step] = self.get(step, 0.0) + seconds
+
+    def timed(self, step, function):
+        """
+        Wrap function to add the time spent calling it to step.
+        """
+        def timed_function(*args, **kwargs):
+            start = default_timer()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self[step] = self.get(step, 0.0) + default_timer() - start
+
+        return timed_function
+
+
+def phase(timings, phase):
+    """
+    Context manager timing phase if timings is not None.
+    """
+    return timings.phase(phase) if timings is not None else _untimed
+
+
+class _Untimed(object):
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_untimed = _Untimed()
+
+
+class Stats(object):
+    """
+    Opt-in instrumentation of the templated sheets of a workbook. Each write, read and save is measured as a
+    Timings object which is appended to `timings` and passed to `callback`, if given, once the operation is done.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.timings = []
+
+    def start(self, operation, sheetname=None):
+        return Timings(operation, sheetname=sheetname)
+
+    def finish(self, timings):
+        self.timings.append(timings)
+        if self.callback:
+            self.callback(timings)
+        return timings
@@ -1,5 +1,8 @@
 from collections import deque
+from copy import copy
 from itertools import chain
+from threading import Lock
+from weakref import WeakKeyDictionary
 
 from openpyxl.styles import NamedStyle, Alignment
 
@@ -68,9 +71,11 @@ class ExtendedStyle:
 
 class StyleSet(object):
     _styles = None
+    _style_arrays = None
 
     def __init__(self, *styles):
         self._styles = {}
+        self._style_arrays = WeakKeyDictionary()
 
         # Make names are only present once and that redeclared names takes precedence
         styles = {style.name: style for style in styles}.values()
@@ -126,17 +131,133 @@ class StyleSet(object):
     def extend(self, extended_style):
         return self._add(extended_style)
 
-    def style_cell(self, cell, style):
+    def freeze(self):
+        """
+        A FrozenStyleSet of the resolved styles of this StyleSet.
+        """
+        return FrozenStyleSet(*self._styles.values())
+
+    def copy(self):
+        """
+        A StyleSet of the same class holding the resolved styles of this one, without resolving them again. Styles
+        added to either are not seen by the other.
+        """
+        style_set = object.__new__(type(self))
+        style_set._styles = dict(self._styles)
+        style_set._style_arrays = WeakKeyDictionary()
+        return style_set
+
+    def resolve(self, style):
         if type(style) in (NamedStyle, ExtendedStyle):
             if style.name not in self:
-                named_style = self._add(style)
-            else:
-                named_style = self[style.name]
-        else:
-            named_style = self[style]
+                return self._add(style)
+            return self[style.name]
+
+        return self[style]
+
+    def style_array(self, workbook, style):
+        """
+        The style array of the named style as registered in the workbook. Named styles are registered in each
+        workbook the first time they are requested, subsequent lookups are served from a cache.
+        """
+        named_style = self.resolve(style)
+        style_arrays = self._style_arrays.setdefault(workbook, {})
+        try:
+            return style_arrays[named_style.name]
+        except KeyError:
+            return self._register(workbook, named_style, style_arrays)
+
+    def _register(self, workbook, named_style, style_arrays):
+        # Workbooks read from a file already contain the named styles, which do not compare equal to the declared ones.
+        # NamedStyles are bound to the workbook they are added to, each workbook is given its own copy.
+        if named_style.name not in workbook.named_styles:
+            workbook.add_named_style(copy_named_style(named_style))
+        style_array = copy(workbook._named_styles[named_style.name].as_tuple())
+        style_arrays[named_style.name] = style_array
+        return style_array
+
+    def register(self, workbook, styles):
+        """
+        Register the styles in the workbook at once, returning their style arrays.
+        """
+        return [self.style_array(workbook, style) for style in styles]
+
+    def style_cell(self, cell, style):
+        # Equivalent to cell.style = named_style without searching the named styles of the workbook for each cell.
+        cell._style = copy(self.style_array(cell.parent.parent, style))
+
+
+class FrozenStyleSet(StyleSet):
+    """
+    A StyleSet which cannot be changed once created, to be shared by any number of workbooks, also between threads.
+    Each workbook is given its own copies of the named styles it uses. Styles which are not part of the set, such
+    as the ExtendedStyles of columns, are resolved once per style object and kept apart from the styles of the set.
+    """
+    _frozen = False
+
+    def __init__(self, *styles):
+        super(FrozenStyleSet, self).__init__(*styles)
+        self._resolved = WeakKeyDictionary()
+        self._lock = Lock()
+        self._frozen = True
+
+    def _add(self, style):
+        if self._frozen:
+            raise TypeError("The styles of a FrozenStyleSet cannot be changed.")
+        return super(FrozenStyleSet, self)._add(style)
 
-        # print("    style cell", named_style.name, type(style), style.name if type(style)!= str else "")
-        cell.style = named_style
+    def freeze(self):
+        return self
+
+    def copy(self):
+        return StyleSet(*self._styles.values())
+
+    def resolve(self, style):
+        if type(style) not in (NamedStyle, ExtendedStyle):
+            return self[style]
+
+        name = style.name
+        if name in self:
+            return self[name]
+        # Keyed by the style itself, different styles of the same name declared elsewhere must not be mixed up.
+        named_style = self._resolved.get(style)
+        if named_style is not None:
+            return named_style
+
+        if isinstance(style, ExtendedStyle):
+            if style.base not in self:
+                raise ParentForExtendedStyleNotFound(style)
+            named_style = style.extend(self[style.base])
+        else:
+            named_style = style
+        with self._lock:
+            return self._resolved.setdefault(style, named_style)
+
+    def style_array(self, workbook, style):
+        named_style = self.resolve(style)
+        try:
+            return self._style_arrays[workbook][named_style.name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            style_arrays = self._style_arrays.setdefault(workbook, {})
+            return self._register(workbook, named_style, style_arrays)
+
+
+def copy_named_style(named_style):
+    # NamedStyles are bound to the workbook they are added to, the font, fill etc. can be shared.
+    return NamedStyle(
+        name=named_style.name,
+        font=named_style.font,
+        fill=named_style.fill,
+        border=named_style.border,
+        alignment=named_style.alignment,
+        number_format=named_style.number_format,
+        protection=named_style.protection,
+        builtinId=named_style.builtinId,
+        hidden=named_style.hidden,
+    )
 
 
 class DefaultStyleSet(StyleSet):
@@ -216,3 +337,17 @@ class DefaultStyleSet(StyleSet):
             ),
             *styles
         )
+
+
+_default_style_set = None
+
+
+def default_style_set():
+    """
+    A DefaultStyleSet for a workbook created without a StyleSet. The styles are resolved once per process and
+    copied into a new DefaultStyleSet for each workbook, which may be extended like any other.
+    """
+    global _default_style_set
+    if _default_style_set is None:
+        _default_style_set = DefaultStyleSet()
+    return _default_style_set.copy()
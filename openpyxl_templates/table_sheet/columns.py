@@ -1,17 +1,25 @@
 from copy import copy
 from datetime import date, datetime, timedelta, time
+from functools import partial
+from operator import itemgetter
+from timeit import default_timer
 from types import FunctionType
 
-from collections import Iterable, defaultdict
-from openpyxl.cell import WriteOnlyCell
+from collections import Iterable, defaultdict, OrderedDict
+from openpyxl.cell import WriteOnlyCell, Cell
 from openpyxl.formatting import Rule
 from openpyxl.styles import NamedStyle
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.utils import get_column_letter, range_boundaries
+from openpyxl.worksheet.datavalidation import DataValidation, collapse_cell_addresses
 
 from openpyxl_templates.exceptions import OpenpyxlTemplateException, CellException
 from openpyxl_templates.styles import ExtendedStyle
-from openpyxl_templates.utils import Typed, FakeCell
+from openpyxl_templates.utils import Typed, FakeCell, coalesce_ranges
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class ColumnIndexNotSet(OpenpyxlTemplateException):
@@ -50,8 +58,30 @@ class RowStyle:
         self.data_validation = data_validation
 
 
+def _validation_key(data_validation):
+    # Data validations compare equal including the cells they apply to.
+    return (
+        tuple((key, value) for key, value in dict(data_validation).items() if key != "sqref"),
+        data_validation.formula1,
+        data_validation.formula2,
+    )
+
+
+def _rule_key(rule):
+    # Rules compare equal including their priority and dxfId, which depend on the worksheet.
+    return rule.type, rule.operator, rule.text, tuple(rule.formula or ()), rule.dxf
+
+
+def _data_validation_ranges(data_validation):
+    if data_validation.cells:
+        # Data validations read from a file list every cell, collapse them as openpyxl does when writing.
+        return collapse_cell_addresses(data_validation.cells, data_validation.ranges).split()
+    return list(data_validation.ranges)
+
+
 class TableColumn(object):
     _column_index = None
+    _column_letter = None
 
     # Reading/writing properties
     _object_attribute = Typed("_object_attribute", expected_type=str, allow_none=True)
@@ -77,6 +107,19 @@ class TableColumn(object):
 
     BLANK_VALUES = (None, "")
 
+    # Whether the values of the column are taken from the objects written. Columns computing their value, such as
+    # FormulaColumn, are also written by TableSheet.write_columns when missing from the mapping.
+    reads_object = True
+
+    # The NumPy dtype of the values of the column when read with TableSheet.read_columns, object if None.
+    dtype = None
+    # Optional vectorised counterpart of from_excel converting a sequence of non blank values to a NumPy array,
+    # raising ValueError or TypeError if the values cannot be converted in one pass.
+    from_excel_batch = None
+    # Optional vectorised counterpart of to_excel converting a NumPy array without blanks to an array of excel
+    # values, raising ValueError or TypeError if the values cannot be converted in one pass.
+    to_excel_batch = None
+
     def __init__(self, header=None, object_attribute=None, source=None, width=None, hidden=None, group=None,
                  data_validation=None, conditional_formatting=None, default=None, allow_blank=None,
                  ignore_forced_text=None, header_style=None, cell_style=None, freeze=False, getter=None,
@@ -177,10 +220,112 @@ class TableColumn(object):
     def from_excel(self, cell, value):
         return value
 
+    def compile_decoder(self):
+        """
+        Resolve the flags of the column once, returning a function which converts a cell like _from_excel. Used by
+        TableSheet when reading rows.
+        """
+        if self._overrides("_from_excel"):
+            return self._from_excel
+
+        ignore_forced_text = self.ignore_forced_text
+        allow_blank = self.allow_blank
+        default = self.default
+        blank_values = self.BLANK_VALUES
+        from_excel = self.from_excel
+
+        def decode(cell):
+            value = cell.value
+            if ignore_forced_text and isinstance(value, str) and value.startswith("'"):
+                value = value[1:]
+
+            if value in blank_values:
+                if not allow_blank:
+                    raise BlankNotAllowed(cell=cell)
+                return default
+
+            return from_excel(cell, value)
+
+        return decode
+
+    def compile_batch_decoder(self):
+        """
+        Like compile_decoder but returning a function which converts a sequence of raw values to a NumPy array in
+        one pass, or None when it cannot. Returns None if NumPy is not installed or the column has no vectorised
+        conversion, in which case the values are converted cell by cell.
+        """
+        if numpy is None or not self._inherits_together("from_excel", "from_excel_batch") or \
+                self._overrides("_from_excel") or self.from_excel_batch is None:
+            return None
+
+        from_excel_batch = self.from_excel_batch
+        allow_blank = self.allow_blank
+        default = self.default
+        blank_values = self.BLANK_VALUES
+        # Blank values without a default are represented by NaN or NaT in floats and datetimes and by None in an
+        # object array otherwise, as as_array does with the values converted cell by cell.
+        if default is not None:
+            blank = default
+        else:
+            blank = {"f": numpy.nan, "M": numpy.datetime64("NaT")}.get(numpy.dtype(self.dtype or object).kind)
+
+        def decode_batch(values):
+            if any(blank_value in values for blank_value in blank_values):
+                if not allow_blank:
+                    return None
+                blanks = numpy.array([value in blank_values for value in values], dtype=bool)
+                present = [value for value, is_blank in zip(values, blanks) if not is_blank]
+            else:
+                blanks = None
+                present = values
+
+            try:
+                array = from_excel_batch(present)
+            except (ValueError, TypeError, OverflowError):
+                return None
+
+            if blanks is None:
+                return array
+
+            if blank is None:
+                result = numpy.empty(len(values), dtype=object)
+                result[~blanks] = array.astype(object)
+            else:
+                result = numpy.empty(len(values), dtype=array.dtype)
+                result[~blanks] = array
+            result[blanks] = blank
+            return result
+
+        return decode_batch
+
+    def as_array(self, values):
+        """
+        The values converted by the column as a NumPy array of the dtype of the column. Falls back on an object
+        array if the values do not fit the dtype and on a list if NumPy is not installed.
+        """
+        if numpy is None:
+            return list(values)
+
+        dtype = self.dtype
+        if dtype is not None and (None not in values or numpy.dtype(dtype).kind in "fM"):
+            try:
+                return numpy.array(values, dtype=dtype)
+            except (ValueError, TypeError, OverflowError):
+                pass
+
+        # Assign one by one, sequences would otherwise be unpacked into an additional dimension.
+        array = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+        return array
+
     def prepare_worksheet(self, worksheet):
-        for data_validation in set(self.data_validations.values()):
-            if data_validation:
-                worksheet.add_data_validation(data_validation)
+        column_dimension = worksheet.column_dimensions[self.column_letter]
+
+        # Hiding of grouped columns is handled on worksheet level.
+        if not self.group:
+            column_dimension.hidden = self.hidden
+        column_dimension.width = self.width
 
     def create_header(self, worksheet, style_set):
         header = WriteOnlyCell(ws=worksheet, value=self.header)
@@ -199,21 +344,260 @@ class TableColumn(object):
         return cell
 
     def post_process_cell(self, worksheet, style_set, cell, row_type=None):
-        data_validation = self.data_validations[row_type]
-        if data_validation:
-            data_validation.add(cell)
-
-        conditional_formatting = self.conditional_formattings[row_type]
-        if conditional_formatting:
-            worksheet.conditional_formatting.add(cell, conditional_formatting)
+        pass
+
+    def compile_encoder(self, worksheet, style_set, row_type=None, encoded=False, timings=None):
+        """
+        Resolve the getter, conversion and style of the column for a row type once, returning a
+        (get_value, create_cell, post_process_cell) tuple of callables used by TableSheet.write_rows.
+        post_process_cell is None when there is nothing to do for the row type. With encoded the rows are tuples of
+        values already converted by encode_batch, unless the column overrides create_cell. If the ColumnTimings
+        `timings` is given the time spent converting and styling is added to it.
+        """
+        if encoded:
+            get_value = itemgetter(self.column_index - 1)
+        else:
+            get_value = self._compile_getter(row_type)
+
+        if self._overrides("create_cell"):
+            create_cell = partial(self.create_cell, worksheet, style_set, row_type=row_type)
+            if timings is not None:
+                create_cell = timings.timed("to_excel", create_cell)
+        elif timings is not None:
+            create_cell = self._compile_timed_create_cell(worksheet, style_set, row_type, encoded, timings)
+        else:
+            _to_excel = self._to_excel
+            default = self.default
+            cell_style = self.cell_styles[row_type]
+            style_array = style_set.style_array(worksheet.parent, cell_style) if cell_style else None
+
+            if encoded:
+                def create_cell(value):
+                    return Cell(worksheet, row=1, col_idx=1, value=value, style_array=style_array)
+            else:
+                def create_cell(value):
+                    return Cell(
+                        worksheet,
+                        row=1,
+                        col_idx=1,
+                        value=_to_excel(value if value is not None else default, row_type=row_type),
+                        style_array=style_array
+                    )
+
+        if self._overrides("post_process_cell"):
+            post_process_cell = partial(self.post_process_cell, worksheet, style_set, row_type=row_type)
+            if timings is not None:
+                post_process_cell = timings.timed("post_process_cell", post_process_cell)
+        else:
+            post_process_cell = None
 
-    def post_process_worksheet(self, worksheet, style_set, first_row, last_row, data_range):
-        column_dimension = worksheet.column_dimensions[self.column_letter]
+        return get_value, create_cell, post_process_cell
 
-        # Hiding of grouped columns is handled on worksheet level.
-        if not self.group:
-            column_dimension.hidden = self.hidden
-        column_dimension.width = self.width
+    def _compile_timed_create_cell(self, worksheet, style_set, row_type, encoded, timings):
+        # Like the create_cell of compile_encoder, timing the conversion and the creation of the styled cell.
+        _to_excel = self._to_excel
+        default = self.default
+        cell_style = self.cell_styles[row_type]
+        timings.setdefault("to_excel", 0.0)
+        timings.setdefault("style_cell", 0.0)
+
+        start = default_timer()
+        style_array = style_set.style_array(worksheet.parent, cell_style) if cell_style else None
+        timings["style_cell"] += default_timer() - start
+
+        def create_cell(value):
+            start = default_timer()
+            if not encoded:
+                value = _to_excel(value if value is not None else default, row_type=row_type)
+            converted = default_timer()
+            cell = Cell(worksheet, row=1, col_idx=1, value=value, style_array=style_array)
+            timings["to_excel"] += converted - start
+            timings["style_cell"] += default_timer() - converted
+            return cell
+
+        return create_cell
+
+    def encode_batch(self, values):
+        """
+        Convert a sequence of values to excel values like _to_excel, returning a list. NaN, NaT and empty strings are
+        blank like None. NumPy arrays are converted in one vectorised pass by the columns which support it. Columns overriding
+        create_cell are left to convert the values themselves.
+        """
+        if self._overrides("create_cell"):
+            return list(values)
+
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if self.to_excel_batch is not None and self._inherits_together("to_excel", "to_excel_batch") and \
+                    not self._overrides("_to_excel"):
+                kind = values.dtype.kind
+                if kind == "f":
+                    missing = numpy.isnan(values)
+                elif kind in "mM":
+                    missing = numpy.isnat(values)
+                elif kind == "U":
+                    missing = values == ""
+                else:
+                    missing = None
+                try:
+                    if missing is None or not missing.any():
+                        return self.to_excel_batch(values).tolist()
+                    encoded = self.to_excel_batch(values[~missing]).tolist()
+                except (ValueError, TypeError, OverflowError):
+                    pass
+                else:
+                    result = [self._to_excel(None)] * len(values)
+                    for index, value in zip(numpy.flatnonzero(~missing).tolist(), encoded):
+                        result[index] = value
+                    return result
+
+            # Nanosecond datetimes are listed as integers, microseconds are the finest resolution of datetime.
+            if values.dtype.kind == "M":
+                values = values.astype("datetime64[us]")
+            values = values.tolist()
+
+        # NaN and NaT, the only values not equal to themselves, are blank like None.
+        _to_excel = self._to_excel
+        default = self.default
+        return [_to_excel(default if value is None or value != value else value) for value in values]
+
+    def _compile_getter(self, row_type):
+        getter = self.getters[row_type]
+        if getter:
+            return partial(getter, self)
+
+        if self._overrides("get_value_from_object") or not isinstance(row_type, type):
+            return partial(self.get_value_from_object, row_type=row_type)
+
+        if issubclass(row_type, (list, tuple)):
+            return itemgetter(self.column_index - 1)
+
+        if issubclass(row_type, dict):
+            return itemgetter(self.object_attribute)
+
+        object_attribute = self.object_attribute
+        return lambda obj: getattr(obj, object_attribute, None)
+
+    def _overrides(self, method_name):
+        return getattr(type(self), method_name) is not getattr(TableColumn, method_name)
+
+    def _inherits_together(self, *method_names):
+        # Whether the methods are all declared by the same class, so that they are known to agree.
+        return len({
+            next(cls for cls in type(self).__mro__ if method_name in cls.__dict__)
+            for method_name in method_names
+        }) == 1
+
+    def post_process_worksheet(self, worksheet, style_set, first_row, last_row, data_range, row_ranges=None):
+        """
+        row_ranges maps each row type written to the (first_row, last_row) ranges of consecutive rows of that type.
+        Data validations and conditional formattings are applied to these ranges rather than to individual cells.
+        """
+        data_validations, conditional_formattings = self._group_row_ranges(row_ranges)
+
+        for data_validation, ranges in data_validations:
+            self._add_data_validation(worksheet, data_validation, ranges)
+
+        for conditional_formatting, ranges in conditional_formattings:
+            worksheet.conditional_formatting.add(" ".join(self._cell_ranges(ranges)), conditional_formatting)
+
+    def extend_worksheet(self, worksheet, style_set, row_ranges, column_index=None):
+        """
+        Apply the data validations and conditional formattings to rows appended to an existing sheet. The ranges of
+        those already applied to the column are extended in place, others are added as by post_process_worksheet.
+        `column_index` is the index of the column of the sheet holding the column, its declared index if None.
+        """
+        column_index = column_index or self.column_index
+        data_validations, conditional_formattings = self._group_row_ranges(row_ranges)
+
+        for data_validation, ranges in data_validations:
+            existing = next((
+                applied for applied in worksheet.data_validations.dataValidation
+                if _validation_key(applied) == _validation_key(data_validation)
+                and self._column_rows(_data_validation_ranges(applied), column_index)[0]
+            ), None)
+            if existing is None:
+                self._add_data_validation(worksheet, data_validation, ranges, column_index)
+                continue
+
+            rows, other_ranges = self._column_rows(_data_validation_ranges(existing), column_index)
+            existing.cells = set()
+            existing.ranges = other_ranges + self._cell_ranges(rows + ranges, column_index)
+
+        cf_rules = worksheet.conditional_formatting.cf_rules
+        for conditional_formatting, ranges in conditional_formattings:
+            try:
+                range_string, rule = next(
+                    (range_string, rule)
+                    for range_string, rules in cf_rules.items() for rule in rules
+                    if _rule_key(rule) == _rule_key(conditional_formatting)
+                    and self._column_rows(range_string.split(), column_index)[0]
+                )
+            except StopIteration:
+                worksheet.conditional_formatting.add(
+                    " ".join(self._cell_ranges(ranges, column_index)), conditional_formatting
+                )
+                continue
+
+            rows, other_ranges = self._column_rows(range_string.split(), column_index)
+            extended = " ".join(other_ranges + self._cell_ranges(rows + ranges, column_index))
+
+            # Move the rule to the extended range, keeping the order of the ranges.
+            items = list(cf_rules.items())
+            cf_rules.clear()
+            for key, rules in items:
+                if key == range_string:
+                    cf_rules.setdefault(extended, []).append(rule)
+                    rules = [other for other in rules if other is not rule]
+                if rules:
+                    cf_rules.setdefault(key, []).extend(rules)
+
+    def _group_row_ranges(self, row_ranges):
+        # Openpyxl objects compare equal on a subset of their attributes, group them by identity.
+        data_validations = OrderedDict()
+        conditional_formattings = OrderedDict()
+        for row_type, ranges in (row_ranges or {}).items():
+            data_validation = self.data_validations[row_type]
+            if data_validation:
+                data_validations.setdefault(id(data_validation), (data_validation, []))[1].extend(ranges)
+
+            conditional_formatting = self.conditional_formattings[row_type]
+            if conditional_formatting:
+                conditional_formattings.setdefault(
+                    id(conditional_formatting),
+                    (conditional_formatting, [])
+                )[1].extend(ranges)
+
+        return data_validations.values(), conditional_formattings.values()
+
+    def _add_data_validation(self, worksheet, data_validation, ranges, column_index=None):
+        # The declared data validation may be shared between worksheets, apply a copy.
+        data_validation = copy(data_validation)
+        data_validation.cells = set()
+        data_validation.ranges = self._cell_ranges(ranges, column_index)
+        worksheet.data_validations.append(data_validation)
+
+    def _column_rows(self, cell_ranges, column_index=None):
+        # Split cell ranges into the (first_row, last_row) ranges within this column and the remaining cell ranges.
+        column_index = column_index or self.column_index
+        rows = []
+        other_ranges = []
+        for cell_range in cell_ranges:
+            min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+            if min_col == max_col == column_index and min_row is not None:
+                rows.append((min_row, max_row))
+            else:
+                other_ranges.append(cell_range)
+        return rows, other_ranges
+
+    def _cell_ranges(self, ranges, column_index=None):
+        column_letter = get_column_letter(column_index) if column_index else self.column_letter
+        cell_ranges = []
+        for first_row, last_row in coalesce_ranges(ranges):
+            if first_row == last_row:
+                cell_ranges.append("%s%d" % (column_letter, first_row))
+            else:
+                cell_ranges.append("%s%d:%s%d" % (column_letter, first_row, column_letter, last_row))
+        return cell_ranges
 
     @property
     def header(self):
@@ -228,10 +612,13 @@ class TableColumn(object):
     @column_index.setter
     def column_index(self, value):
         self._column_index = value
+        self._column_letter = get_column_letter(value) if value is not None else None
 
     @property
     def column_letter(self):
-        return get_column_letter(self.column_index)
+        if self._column_letter is None:
+            raise ColumnIndexNotSet(self)
+        return self._column_letter
 
     @property
     def object_attribute(self):
@@ -277,12 +664,26 @@ class CharColumn(TableColumn):
 
         return value
 
+    def from_excel_batch(self, values):
+        if set(map(type, values)) - {str}:
+            raise TypeError("Only strings are converted in one pass.")
+        if self.ignore_forced_text and any(value[:1] == "'" for value in values):
+            raise ValueError("Forced text is converted cell by cell.")
+        if self.max_length is not None and values and max(map(len, values)) > self.max_length:
+            raise ValueError("String too long.")
+        return numpy.array(values, dtype=object)
+
     def to_excel(self, value, row_type=None):
         if value is None:
             return ""
 
         return str(value)
 
+    def to_excel_batch(self, array):
+        if array.dtype.kind != "U":
+            raise TypeError("Only string arrays are converted in one pass.")
+        return array
+
 
 class TextColumn(CharColumn):
     def __init__(self, **kwargs):
@@ -308,6 +709,8 @@ class UnableToParseBool(UnableToParseException):
 
 
 class BoolColumn(TableColumn):
+    dtype = "bool"
+
     excel_true = Typed(name="excel_true", value=True, expected_types=(str, int, float, bool))
     excel_false = Typed(name="excel_false", value=False, expected_types=(str, int, float, bool))
 
@@ -334,6 +737,13 @@ class BoolColumn(TableColumn):
     def to_excel(self, value, row_type=None):
         return self.excel_true if value else self.excel_false
 
+    def to_excel_batch(self, array):
+        if array.dtype.kind not in "biuf":
+            raise TypeError("Only numeric arrays are converted in one pass.")
+        if self.excel_true is True and self.excel_false is False:
+            return array.astype(bool)
+        return numpy.where(array.astype(bool), self.excel_true, self.excel_false).astype(object)
+
     def from_excel(self, cell, value):
         if isinstance(value, bool):
             return value
@@ -349,12 +759,19 @@ class BoolColumn(TableColumn):
 
         return bool(value)
 
+    def from_excel_batch(self, values):
+        if set(map(type, values)) - {bool}:
+            raise TypeError("Only boolean values are converted in one pass.")
+        return numpy.array(values, dtype=bool)
+
 
 class UnableToParseFloat(UnableToParseException):
     type = "float"
 
 
 class FloatColumn(TableColumn):
+    dtype = "float64"
+
     def __init__(self, **kwargs):
         kwargs.setdefault("cell_style", "Row, decimal")
         kwargs.setdefault("default", 0.0)
@@ -366,12 +783,20 @@ class FloatColumn(TableColumn):
         except (ValueError, TypeError):
             raise UnableToParseFloat(value=value)
 
+    def to_excel_batch(self, array):
+        if array.dtype.kind not in "biuf":
+            raise TypeError("Only numeric arrays are converted in one pass.")
+        return array.astype(numpy.float64)
+
     def from_excel(self, cell, value):
         try:
             return float(value)
         except (ValueError, TypeError):
             raise UnableToParseFloat(cell=cell)
 
+    def from_excel_batch(self, values):
+        return numpy.array(values, dtype=numpy.float64)
+
 
 class UnableToParseInt(UnableToParseException):
     type = "int"
@@ -386,6 +811,7 @@ class RoundingRequired(CellException):
 
 
 class IntColumn(FloatColumn):
+    dtype = "int64"
     round_value = Typed("round_value", expected_type=bool, value=True)
 
     def __init__(self, header=None, round_value=None, **kwargs):
@@ -405,6 +831,20 @@ class IntColumn(FloatColumn):
         except (ValueError, TypeError):
             raise UnableToParseInt(value=value)
 
+    def to_excel_batch(self, array):
+        kind = array.dtype.kind
+        if kind in "biu":
+            return array.astype(numpy.int64)
+        if kind != "f":
+            raise TypeError("Only numeric arrays are converted in one pass.")
+
+        i = numpy.round(array)
+        if not numpy.all(numpy.abs(i) < 2 ** 63):
+            raise ValueError("Values are not finite or too large for int64.")
+        if not self.round_value and numpy.any(i != array):
+            raise ValueError("Rounding required.")
+        return i.astype(numpy.int64)
+
     def from_excel(self, cell, value):
         try:
             f = float(value)
@@ -415,6 +855,15 @@ class IntColumn(FloatColumn):
         except (ValueError, TypeError):
             raise UnableToParseInt(cell)
 
+    def from_excel_batch(self, values):
+        f = numpy.array(values, dtype=numpy.float64)
+        i = numpy.round(f)
+        if not numpy.all(numpy.abs(i) < 2 ** 63):
+            raise ValueError("Values are not finite or too large for int64.")
+        if not self.round_value and numpy.any(i != f):
+            raise ValueError("Rounding required.")
+        return i.astype(numpy.int64)
+
 
 class IllegalChoice(CellException):
     def __init__(self, cell, choices):
@@ -484,6 +933,16 @@ class UnableToParseDatetime(UnableToParseException):
 
 class DatetimeColumn(TableColumn):
     SECONDS_PER_DAY = 24 * 60 * 60
+    MICROSECONDS_PER_DAY = SECONDS_PER_DAY * 1000000
+
+    # Excel serials count days from 1900-01-00, but Excel incorrectly assumes 1900 to be a leap year. Serials from 61
+    # (1900-03-01) are therefore days since 1899-12-30 and earlier serials days since 1899-12-31.
+    EXCEL_EPOCH = datetime(year=1899, month=12, day=30)
+    EXCEL_EPOCH_BEFORE_LEAP_DAY = datetime(year=1899, month=12, day=31)
+    EXCEL_EPOCH_ORDINAL = EXCEL_EPOCH.toordinal()
+    # Days from the excel epoch to the NumPy epoch 1970-01-01
+    NUMPY_EPOCH_SERIAL = 25569
+    dtype = "datetime64[us]"
 
     def __init__(self, **kwargs):
         kwargs.setdefault("cell_style", "Row, date")
@@ -495,50 +954,102 @@ class DatetimeColumn(TableColumn):
             return value
 
         if type(value) in (int, float):
-            # Excel dates start at 1900-01-01
-            if value < 1:
-                raise UnableToParseDatetime(cell)
-
-            result = datetime(year=1900, month=1, day=1) + timedelta(days=value - 2)
-
-            # Excel incorrectly assumes 1900 to be a leap year.
             if value < 61:
-                result += timedelta(days=1)
-            return result
+                if value < 1:
+                    raise UnableToParseDatetime(cell)
+                return self.EXCEL_EPOCH_BEFORE_LEAP_DAY + timedelta(days=value)
+            return self.EXCEL_EPOCH + timedelta(days=value)
 
         raise UnableToParseDatetime(cell)
 
+    def from_excel_batch(self, values):
+        types = set(map(type, values))
+        if not types - {int, float}:
+            return self.serials_to_datetime64(numpy.array(values, dtype=numpy.float64))
+
+        if types - {datetime} or any(value.tzinfo for value in values):
+            raise TypeError("Only naive datetimes and excel serials are converted in one pass.")
+        return numpy.array(values, dtype="datetime64[us]")
+
     def to_excel(self, value, row_type=None):
         if type(value) == date:
             value = datetime.combine(value, time.min)
         if not isinstance(value, datetime):
             raise UnableToParseDatetime(value=value)
 
-        delta = (value - datetime(year=1900, month=1, day=1, tzinfo=value.tzinfo))
-        value = delta.days + delta.seconds / self.SECONDS_PER_DAY + 2
+        # Days since 1900-01-01 and the fraction of the day, ignoring fractions of seconds.
+        value = (value.toordinal() - self.EXCEL_EPOCH_ORDINAL - 2) + \
+            (value.hour * 3600 + value.minute * 60 + value.second) / self.SECONDS_PER_DAY + 2
 
-        # Excel incorrectly assumes 1900 to be a leap year.
         if value < 61:
             if value < 1:
                 raise UnableToParseDatetime(value=value)
             value -= 1
         return value
 
+    def to_excel_batch(self, array):
+        if array.dtype.kind != "M":
+            raise TypeError("Only datetime64 arrays are converted in one pass.")
+        return self.datetime64_to_serials(array)
+
+    @classmethod
+    def serials_to_datetime64(cls, serials):
+        """
+        Vectorised from_excel of an array of excel serials, rounded to microseconds exactly like timedelta.
+        """
+        if numpy.any(serials < 1):
+            raise ValueError("Excel serials start at 1.")
+
+        days = numpy.trunc(serials)
+        microseconds = (serials - days) * cls.MICROSECONDS_PER_DAY
+        whole_microseconds = numpy.trunc(microseconds)
+        leftover = microseconds - whole_microseconds
+        microseconds = (
+            (days.astype(numpy.int64) + (serials < 61) - cls.NUMPY_EPOCH_SERIAL) * cls.MICROSECONDS_PER_DAY +
+            whole_microseconds.astype(numpy.int64)
+        )
+        # timedelta rounds the leftover half to even on the total number of microseconds.
+        microseconds += numpy.where(leftover == 0.5, microseconds & 1, numpy.rint(leftover).astype(numpy.int64))
+        return microseconds.astype("datetime64[us]")
+
+    @classmethod
+    def datetime64_to_serials(cls, array):
+        """
+        Vectorised to_excel of a datetime64 array.
+        """
+        # Days since 1900-01-01 and the fraction of the day, ignoring fractions of seconds, summed in the same order as
+        # to_excel to give the exact same serials.
+        seconds = array.astype("datetime64[us]").astype(numpy.int64) // 1000000
+        days, seconds = numpy.divmod(seconds, cls.SECONDS_PER_DAY)
+        serials = (days + (cls.NUMPY_EPOCH_SERIAL - 2)) + seconds / cls.SECONDS_PER_DAY + 2
+
+        if numpy.any(serials < 1):
+            raise ValueError("Dates before 1900 cannot be represented in excel.")
+        return numpy.where(serials < 61, serials - 1, serials)
+
 
 class UnableToParseDate(UnableToParseException):
     type = "Row, date"
 
 
 class DateColumn(DatetimeColumn):
+    dtype = "datetime64[D]"
+
     def from_excel(self, cell, value):
         try:
             return super(DateColumn, self).from_excel(cell, value).date()
         except UnableToParseDatetime:
             raise UnableToParseDate(cell=cell)
 
+    def from_excel_batch(self, values):
+        return super(DateColumn, self).from_excel_batch(values).astype("datetime64[D]")
+
     def to_excel(self, value):
         return int(super(DateColumn, self).to_excel(value))
 
+    def to_excel_batch(self, array):
+        return super(DateColumn, self).to_excel_batch(array).astype(numpy.int64)
+
 
 class YearColumn(DateColumn):
     def __init__(self, **kwargs):
@@ -551,6 +1062,8 @@ class UnableToParseTime(UnableToParseException):
 
 
 class TimeColumn(DatetimeColumn):
+    dtype = None
+
     def __init__(self, **kwargs):
         kwargs.setdefault("cell_style", "Row, time")
         super(TimeColumn, self).__init__(**kwargs)
@@ -564,6 +1077,18 @@ class TimeColumn(DatetimeColumn):
         except UnableToParseDatetime:
             raise UnableToParseTime(cell)
 
+    def from_excel_batch(self, values):
+        types = set(map(type, values))
+        if types == {time}:
+            return numpy.array(values, dtype=object)
+        if types - {int, float}:
+            raise TypeError("Only times and excel serials are converted in one pass.")
+
+        return numpy.array(
+            [value.time() for value in self.serials_to_datetime64(numpy.array(values, dtype=numpy.float64)).tolist()],
+            dtype=object
+        )
+
     def to_excel(self, value):
         _type = type(value)
 
@@ -579,6 +1104,11 @@ class TimeColumn(DatetimeColumn):
         if _type == date:
             return time.min
 
+    def to_excel_batch(self, array):
+        if array.dtype.kind != "M":
+            raise TypeError("Only datetime64 arrays are converted in one pass.")
+        return numpy.array([value.time() for value in array.astype("datetime64[us]").tolist()], dtype=object)
+
 
 class NoFormula(OpenpyxlTemplateException):
     def __init__(self):
@@ -587,6 +1117,7 @@ class NoFormula(OpenpyxlTemplateException):
 
 class FormulaColumn(TableColumn):
     formula = Typed(name="formula", expected_type=str, allow_none=True)
+    reads_object = False
 
     def __init__(self, formula=None, **kwargs):
         self.formula = formula
@@ -601,5 +1132,7 @@ class FormulaColumn(TableColumn):
 
 
 class EmptyColumn(TableColumn):
+    reads_object = False
+
     def get_value_from_object(self, obj, row_type=None):
         return None
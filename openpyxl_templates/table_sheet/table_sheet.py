@@ -1,17 +1,20 @@
 import re
-from collections import Counter, namedtuple
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict, namedtuple
 from enum import Enum
-from itertools import chain, repeat, groupby
+from functools import partial
+from itertools import chain, repeat, groupby, islice
+from operator import itemgetter, eq
+from timeit import default_timer
 
 from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table
 
+from openpyxl_templates import profiling
 from openpyxl_templates.exceptions import CellExceptions, RowExceptions, SheetException, CellException
-from openpyxl_templates.table_sheet.columns import TableColumn
+from openpyxl_templates.table_sheet.columns import TableColumn, numpy
 from openpyxl_templates.templated_sheet import TemplatedWorksheet
-from openpyxl_templates.utils import Typed, MAX_COLUMN_INDEX
+from openpyxl_templates.utils import Typed, MAX_COLUMN_INDEX, ValueCell, refresh_print_titles
 
 
 class TableSheetException(SheetException):
@@ -77,6 +80,44 @@ class CannotHideOrGroupLastColumn(TableSheetException):
         )
 
 
+class CannotPreserveWriteOnlySheet(TableSheetException):
+    def __init__(self, table_sheet):
+        super(CannotPreserveWriteOnlySheet, self).__init__(
+            "The content of TableSheet '%s' cannot be preserved since the workbook is write only." %
+            table_sheet.sheetname
+        )
+
+
+class ColumnLengthsDiffer(TableSheetException):
+    def __init__(self, table_sheet):
+        super(ColumnLengthsDiffer, self).__init__(
+            "The columns written to TableSheet '%s' are not of the same length." % table_sheet.sheetname
+        )
+
+
+class ColumnNotFound(TableSheetException):
+    def __init__(self, table_sheet, column):
+        super(ColumnNotFound, self).__init__(
+            "The TableSheet '%s' has no column '%s'." % (table_sheet.sheetname, column)
+        )
+
+
+class ColumnNotInMapping(TableSheetException):
+    def __init__(self, table_sheet, column):
+        super(ColumnNotInMapping, self).__init__(
+            "The column '%s' of TableSheet '%s' takes its values from the objects through a getter, it cannot be "
+            "left out of the columns written." % (column.header, table_sheet.sheetname)
+        )
+
+
+class EncodedRow(object):
+    """
+    The row type of the rows written by TableSheet.write_columns, whose values have already been converted by the
+    columns.
+    """
+    pass
+
+
 class TableSheetExceptionPolicy(Enum):
     RaiseCellException = 1
     RaiseRowException = 2
@@ -84,6 +125,137 @@ class TableSheetExceptionPolicy(Enum):
     IgnoreRow = 4
 
 
+class HeaderMatching(Enum):
+    Exact = 1
+    Reordered = 2
+    Fuzzy = 3
+
+
+class HeaderLocator(object):
+    """
+    Recognizes the header row of a TableSheet. Exact matching requires the headers in the order of the columns
+    starting from the first cell. Reordered matching accepts the headers in any order and position, fuzzy matching
+    also ignores case and whitespace and accepts close matches.
+    """
+    fuzzy_cutoff = 0.8
+
+    def __init__(self, headers, header_matching=HeaderMatching.Exact):
+        self.headers = tuple(headers)
+        self.header_matching = header_matching
+        self.normalize = normalize_header if header_matching == HeaderMatching.Fuzzy else str
+        self.indexes = {self.normalize(header): index for index, header in enumerate(self.headers)}
+        self.identity = tuple(range(len(self.headers)))
+
+    def match(self, values):
+        """
+        The position within the row of the header of each column, or None if the row is not the header row.
+        """
+        headers = self.headers
+        if self.header_matching == HeaderMatching.Exact:
+            # Most rows before the header are rejected on their first cell.
+            if str(values[0] if values else None) != headers[0]:
+                return None
+            for value, header in zip(chain(values, repeat(None)), headers):
+                if str(value) != header:
+                    return None
+            return self.identity
+
+        if len(values) < len(headers):
+            return None
+
+        normalize = self.normalize
+        indexes = self.indexes
+        positions = [None] * len(headers)
+        unmatched = OrderedDict()
+        for position, value in enumerate(values):
+            if value is None:
+                continue
+            value = normalize(value)
+            index = indexes.get(value)
+            if index is not None and positions[index] is None:
+                positions[index] = position
+            else:
+                unmatched.setdefault(value, position)
+
+        if None in positions and self.header_matching == HeaderMatching.Fuzzy:
+            from difflib import get_close_matches
+            for index, header in enumerate(headers):
+                if positions[index] is None:
+                    close_matches = get_close_matches(normalize(header), unmatched, n=1, cutoff=self.fuzzy_cutoff)
+                    if close_matches:
+                        positions[index] = unmatched.pop(close_matches[0])
+
+        if None in positions:
+            return None
+        return tuple(positions)
+
+
+def normalize_header(value):
+    return " ".join(str(value).split()).lower()
+
+
+class ColumnLayout(namedtuple("ColumnLayout", ("column", "index", "letter", "header"))):
+    __slots__ = ()
+
+    def data_range(self, first_row, last_row):
+        return "%s%d:%s%d" % (self.letter, first_row, self.letter, last_row)
+
+
+class TableSheetLayout(object):
+    """
+    The geometry of the columns of a TableSheet, their index, letter and header, resolved once the columns are
+    validated. `columns` holds a ColumnLayout per column, `groups` the first and last ColumnLayout of each group of
+    consecutive grouped columns.
+    """
+    __slots__ = ("columns", "headers", "letters", "groups", "excess_start")
+
+    def __init__(self, columns):
+        self.columns = tuple(
+            ColumnLayout(column, column.column_index, column.column_letter, column.header) for column in columns
+        )
+        self.headers = tuple(column_layout.header for column_layout in self.columns)
+        self.letters = tuple(column_layout.letter for column_layout in self.columns)
+        self.groups = tuple(
+            (group[0], group[-1])
+            for group in (
+                tuple(group) for grouped, group in groupby(self.columns, lambda layout: layout.column.group)
+                if grouped
+            )
+        )
+        self.excess_start = get_column_letter(len(self.columns) + 1)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+
+class TableSheetSchema(object):
+    """
+    The declared columns of a TableSheet class once added and validated: the columns, their layout and the row
+    class. Compiled by the first instance of the class created without extra columns or row
+    styles and shared by the following ones.
+    """
+    __slots__ = ("columns", "row_styles", "column_headers_counter", "layout", "row_class", "suffix_duplicated_headers")
+
+    def __init__(self, table_sheet):
+        self.columns = tuple(table_sheet.columns)
+        self.row_styles = tuple(table_sheet.row_styles)
+        self.column_headers_counter = Counter(table_sheet._column_headers_counter)
+        self.layout = table_sheet.layout
+        self.row_class = table_sheet.row_class
+        self.suffix_duplicated_headers = table_sheet.suffix_duplicated_headers
+
+    def apply(self, table_sheet):
+        table_sheet.columns = list(self.columns)
+        table_sheet.row_styles = list(self.row_styles)
+        table_sheet._column_headers_counter = Counter(self.column_headers_counter)
+        table_sheet._column_index = len(self.columns) + 1
+        table_sheet._layout = self.layout
+        table_sheet._row_class = self.row_class
+
+
 class TableSheet(TemplatedWorksheet):
     item_class = TableColumn
 
@@ -105,6 +277,8 @@ class TableSheet(TemplatedWorksheet):
     # fit_to_width = Typed("fit_to_width", expected_types=)
 
     look_for_headers = Typed("look_for_headers", expected_type=bool, value=True)
+    header_matching = Typed("header_matching", expected_type=HeaderMatching, value=HeaderMatching.Exact)
+    header_scan_limit = Typed("header_scan_limit", expected_type=int, allow_none=True)
     suffix_duplicated_headers = Typed("suffix_duplicated_headers", expected_type=bool, value=True)
     exception_policy = Typed(
         "exception_policy",
@@ -116,13 +290,24 @@ class TableSheet(TemplatedWorksheet):
     _last_data_cell = None
     _first_header_cell = None
     _last_header_cell = None
+    _row_ranges = None
     _row_class = None
+    _row_decoder = None
+    _row_converter = None
+    _header_locator = None
+    _projections = None
+    # The letters of the columns of the sheet read by the columns when located elsewhere than declared, else None.
+    _column_letters = None
+    _layout = None
+    _column_styles = None
+    _schema = None
     _column_index = 1
 
     def __init__(self, sheetname=None, active=None, table_name=None, title_style=None, description_style=None,
                  format_as_table=None, freeze_header=None, hide_excess_columns=None, look_for_headers=None,
                  exception_policy=None, columns=None, print_title_rows=None, print_title_columns=None,
-                 suffix_duplicated_headers=None, freeze_column=None, row_styles=None):
+                 suffix_duplicated_headers=None, freeze_column=None, row_styles=None, header_matching=None,
+                 header_scan_limit=None):
         super(TableSheet, self).__init__(sheetname=sheetname, active=active)
 
         self._table_name = table_name
@@ -133,28 +318,47 @@ class TableSheet(TemplatedWorksheet):
         self.freeze_column = freeze_column
         self.hide_excess_columns = hide_excess_columns
         self.look_for_headers = look_for_headers
+        self.header_matching = header_matching
+        self.header_scan_limit = header_scan_limit
         self.exception_policy = exception_policy
         self.print_title_rows = print_title_rows
         self.print_title_columns = print_title_columns
         self.suffix_duplicated_headers = suffix_duplicated_headers
 
+        schema = self._schema if columns is None and row_styles is None else None
+        if schema is not None and schema.suffix_duplicated_headers == self.suffix_duplicated_headers:
+            # The declared columns have been added and validated by a previous instance.
+            schema.apply(self)
+            self._check_last_column_not_hidden_or_grouped_if_hide_excess_columns()
+            return
+
+        # Copied, the row styles of the class must not grow with each instance.
+        self.row_styles = list(row_styles or self.row_styles or [])
+
         self.columns = []
         self._column_headers_counter = Counter()
         for object_attribute, column in self._items.items():
             self.add_column(column, object_attribute=object_attribute)
-        self.row_styles = row_styles or self.row_styles or []
 
         for column in columns or []:
             self.add_column(column)
-        self.add_row_style(*self.row_styles)
 
         self._validate()
 
+        if columns is None and row_styles is None:
+            type(self)._schema = TableSheetSchema(self)
+
+    @staticmethod
+    def __register_objects__(cls, classdict):
+        # Called by OrderedType for each subclass, which compiles its own schema.
+        cls._schema = None
+
     def _validate(self):
         self._check_atleast_one_column()
         self._check_unique_column_headers()
         self._check_max_one_frozen_column()
         self._check_last_column_not_hidden_or_grouped_if_hide_excess_columns()
+        self._layout = TableSheetLayout(self.columns)
 
     def _check_atleast_one_column(self):
         if not self.columns:
@@ -184,6 +388,13 @@ class TableSheet(TemplatedWorksheet):
 
         self.columns.append(column)
         self._row_class = None
+        self._row_decoder = None
+        self._row_converter = None
+        self._header_locator = None
+        self._projections = None
+        self._column_letters = None
+        self._layout = None
+        self._column_styles = None
 
         column.add_row_style(*self.row_styles)
 
@@ -199,25 +410,178 @@ class TableSheet(TemplatedWorksheet):
             column.add_row_style(*row_styles)
 
         self.row_styles.extend(row_styles)
+        self._column_styles = None
 
     def write(self, objects=None, title=None, description=None, preserve=False):
         if not self.empty:
             if preserve:
-                objects = chain(list(self.read()), objects)
+                return self.append(objects)
             self.remove()
 
+        timings = self._start_timings("write")
+        self._write(objects, title, description, timings=timings)
+        self._finish_timings(timings)
+
+    def append(self, objects, encoded=False):
+        """
+        Append rows after the last row of the existing sheet without reading or rewriting it. The values are written
+        below the headers located as by read, also when reordered. The table, data validations and conditional
+        formattings of the columns are extended over the new rows.
+        """
+        if self.workbook.write_only:
+            raise CannotPreserveWriteOnlySheet(self)
+
+        timings = self._start_timings("append")
+        self._append(objects, encoded=encoded, timings=timings)
+        self._finish_timings(timings)
+
+    def _append(self, objects, encoded=False, timings=None):
+        if self.empty:
+            return self._write(objects, encoded=encoded, timings=timings)
+
         worksheet = self.worksheet
-        self.prepare_worksheet(worksheet)
-        self.write_title(worksheet, title)
-        self.write_description(worksheet, description)
-        self.write_headers(worksheet)
-        self.write_rows(worksheet, objects)
-        self.post_process_worksheet(worksheet)
+        with profiling.phase(timings, "locate_headers"):
+            table = self._find_table(worksheet)
+            # The columns are written where their headers are found, which need not be the declared order.
+            header_row, positions = self._locate_headers(enumerate(self.iter_values(), start=1))
+            self._first_header_cell = worksheet.cell(row=header_row, column=min(positions) + 1)
+            self._last_header_cell = worksheet.cell(row=header_row, column=max(positions) + 1)
+
+        with profiling.phase(timings, "write_rows"):
+            self.write_rows(worksheet, objects, encoded=encoded, timings=timings, positions=positions)
+        if not self._first_data_cell:
+            return
+
+        with profiling.phase(timings, "post_process_worksheet"):
+            self._extend_worksheet(worksheet, table, positions)
+
+    def _extend_worksheet(self, worksheet, table=None, positions=None):
+        for column, position in zip(self.columns, positions or range(len(self.columns))):
+            column.extend_worksheet(
+                worksheet, self.template_styles, row_ranges=self._row_ranges, column_index=position + 1
+            )
+
+        if table:
+            table.ref = "%s:%s" % (self._first_header_cell.coordinate, self._last_data_cell.coordinate)
+            if table.autoFilter is not None:
+                table.autoFilter.ref = table.ref
+        elif self.format_as_table:
+            worksheet.add_table(Table(
+                ref="%s:%s" % (self._first_header_cell.coordinate, self._last_data_cell.coordinate),
+                displayName=self.table_name
+            ))
+
+    def _find_table(self, worksheet):
+        tables = worksheet._tables
+        # Newer versions of openpyxl keep the tables by name.
+        for table in (tables.values() if hasattr(tables, "values") else tables):
+            if table.displayName == self.table_name:
+                return table
+        return None
+
+    def awrite(self, objects, title=None, description=None, preserve=False, batch_size=1000, executor=None):
+        """
+        Coroutine writing the objects of an async iterable. The rows are encoded and written in `executor`, the
+        default executor of the event loop if None, while the event loop fetches batches of `batch_size` objects.
+        """
+        from openpyxl_templates import aio
+        return aio.write(
+            self, objects, batch_size=batch_size, executor=executor, title=title, description=description,
+            preserve=preserve
+        )
+
+    def write_columns(self, columns, title=None, description=None, preserve=False):
+        """
+        Write the sheet from a mapping of object attributes to sequences of values, such as NumPy arrays, all of the
+        same length. Each column is converted in one pass before the rows are written. Columns missing from the
+        mapping are written with their default, or their computed value for columns such as FormulaColumn which do
+        not read the objects. Columns reading the objects through a getter cannot be missing.
+        """
+        lengths = set(len(values) for values in columns.values())
+        if len(lengths) > 1:
+            raise ColumnLengthsDiffer(self)
+        length = lengths.pop() if lengths else 0
+
+        if not self.empty and preserve and self.workbook.write_only:
+            raise CannotPreserveWriteOnlySheet(self)
+
+        timings = self._start_timings("append" if preserve and not self.empty else "write")
+        with profiling.phase(timings, "encode_columns"):
+            rows = zip(*(self._encode_column(column, columns, length, timings) for column in self.columns))
+
+        if not self.empty:
+            if preserve:
+                self._append(rows, encoded=True, timings=timings)
+                return self._finish_timings(timings)
+            self.remove()
+
+        self._write(rows, title, description, encoded=True, timings=timings)
+        self._finish_timings(timings)
+
+    def _encode_column(self, column, columns, length, timings=None):
+        encode_batch = column.encode_batch
+        if timings is not None:
+            encode_batch = timings.column(column.header).timed("to_excel", encode_batch)
+
+        if column.object_attribute in columns:
+            return encode_batch(columns[column.object_attribute])
+
+        if not column.reads_object:
+            value = encode_batch((column.get_value_from_object(None),))[0]
+        elif column.getter or any(column.getters.values()) or column._overrides("get_value_from_object"):
+            raise ColumnNotInMapping(self, column)
+        else:
+            # Columns missing from the mapping are blank, written as the default of the column.
+            value = encode_batch((None,))[0]
+        return [value] * length
+
+    def _write(self, objects, title=None, description=None, encoded=False, timings=None):
+        worksheet = self.worksheet
+        with profiling.phase(timings, "prepare_worksheet"):
+            self.prepare_worksheet(worksheet)
+            if self.workbook.write_only:
+                # Write only worksheets serialize the sheet view together with the first row. The freeze pane must
+                # therefore be set before anything is written, assuming that the data starts just below the headers.
+                self.freeze_panes(worksheet, first_row=1 + bool(title) + bool(description) + 1)
+        with profiling.phase(timings, "write_headers"):
+            self.write_title(worksheet, title)
+            self.write_description(worksheet, description)
+            self.write_headers(worksheet)
+        with profiling.phase(timings, "write_rows"):
+            self.write_rows(worksheet, objects, encoded=encoded, timings=timings)
+        with profiling.phase(timings, "post_process_worksheet"):
+            self.post_process_worksheet(worksheet)
+
+    def _start_timings(self, operation):
+        # Timings of an operation on the sheet, None unless the workbook collects stats.
+        return self.stats.start(operation, sheetname=self.sheetname) if self.stats is not None else None
+
+    def _finish_timings(self, timings):
+        if timings is not None:
+            self.stats.finish(timings)
 
     def prepare_worksheet(self, worksheet):
         for column in self.columns:
             column.prepare_worksheet(worksheet)
 
+        # Grouping
+        layout = self.layout
+        for first, last in layout.groups:
+            worksheet.column_dimensions.group(
+                start=first.letter,
+                end=last.letter,
+                outline_level=1,
+                hidden=first.column.hidden
+            )
+
+        if self.hide_excess_columns:
+            worksheet.column_dimensions.group(
+                start=layout.excess_start,
+                end=get_column_letter(MAX_COLUMN_INDEX + 1),
+                outline_level=0,
+                hidden=True
+            )
+
     def write_title(self, worksheet, title=None):
         if not title:
             return
@@ -247,68 +611,108 @@ class TableSheet(TemplatedWorksheet):
         self._first_header_cell = headers[0]
         self._last_header_cell = headers[-1]
 
-    def write_rows(self, worksheet, objects=None):
+    def write_rows(self, worksheet, objects=None, encoded=False, timings=None, positions=None):
+        """
+        Append a row per object. `positions` gives the zero based index of the column of the sheet each column is
+        written to, the declared order if None.
+        """
         self._first_data_cell = None
+        self._row_ranges = {}
+        encoders = {}
         cells = None
+
+        arrange = None
+        first_index, last_index = 0, -1
+        if positions is not None and tuple(positions) != tuple(range(len(positions))):
+            first_index = positions.index(min(positions))
+            last_index = positions.index(max(positions))
+            arrange = partial(self._arrange_cells, positions, max(positions) + 1)
         for index, obj in enumerate(objects):
-            row_type = self.row_type(obj, index)
-            cells = tuple(
-                column.create_cell(
-                    worksheet,
-                    self.template_styles,
-                    column.get_value_from_object(obj, row_type=row_type),
-                    row_type=row_type
-                ) for column in self.columns
-            )
-            worksheet.append(cells)
+            row_type = EncodedRow if encoded else self.row_type(obj, index)
+            try:
+                cell_encoders, post_processors, row_ranges = encoders[row_type]
+            except KeyError:
+                cell_encoders, post_processors = self.compile_row_encoder(
+                    worksheet, row_type, encoded=encoded, timings=timings
+                )
+                row_ranges = self._row_ranges[row_type] = []
+                encoders[row_type] = cell_encoders, post_processors, row_ranges
+
+            cells = [create_cell(get_value(obj)) for get_value, create_cell in cell_encoders]
+            worksheet.append(arrange(cells) if arrange else cells)
 
             if not self._first_data_cell:
-                self._first_data_cell = cells[0]
+                self._first_data_cell = cells[first_index]
 
-            for cell, column in zip(cells, self.columns):
-                column.post_process_cell(worksheet, self.template_styles, cell, row_type=row_type)
+            # Keep track of consecutive rows of the same row type
+            row = cells[0].row
+            if row_ranges and row_ranges[-1][1] == row - 1:
+                row_ranges[-1] = (row_ranges[-1][0], row)
+            else:
+                row_ranges.append((row, row))
+
+            for cell_index, post_process_cell in post_processors:
+                post_process_cell(cells[cell_index])
 
         if cells:
-            self._last_data_cell = cells[-1]
+            self._last_data_cell = cells[last_index]
+
+        if timings is not None:
+            timings.rows += sum(last - first + 1 for ranges in self._row_ranges.values() for first, last in ranges)
+
+    @staticmethod
+    def _arrange_cells(positions, width, cells):
+        # Place the cells of a row at the positions of their columns, the columns in between are left empty.
+        row = [None] * width
+        for position, cell in zip(positions, cells):
+            row[position] = cell
+        return row
+
+    def compile_row_encoder(self, worksheet, row_type=None, encoded=False, timings=None):
+        cell_encoders = []
+        post_processors = []
+        for index, column in enumerate(self.columns):
+            get_value, create_cell, post_process_cell = column.compile_encoder(
+                worksheet,
+                self.template_styles,
+                row_type=row_type,
+                encoded=encoded,
+                timings=timings.column(column.header) if timings is not None else None
+            )
+            cell_encoders.append((get_value, create_cell))
+            if post_process_cell:
+                post_processors.append((index, post_process_cell))
+
+        return tuple(cell_encoders), tuple(post_processors)
 
     def post_process_worksheet(self, worksheet):
         first_row = (self._first_data_cell or self._first_header_cell).row
         last_row = (self._last_data_cell or self._first_header_cell).row
 
-        for column in self.columns:
-            column_letter = column.column_letter
-
-            column.post_process_worksheet(
+        for column_layout in self.layout:
+            column_layout.column.post_process_worksheet(
                 worksheet,
                 self.template_styles,
                 first_row=first_row,
                 last_row=last_row,
-                data_range="%s%s:%s%s" % (column_letter, first_row, column_letter, last_row)
+                data_range=column_layout.data_range(first_row, last_row),
+                row_ranges=self._row_ranges
             )
 
         if self.format_as_table:
-            worksheet.add_table(
-                Table(
-                    ref="%s:%s" % (
-                        self._first_header_cell.coordinate,
-                        self._last_data_cell.coordinate if self._last_data_cell
-                        else "{0}{1}".format(self._last_header_cell.column, self._last_header_cell.row + 1)
-                    ),
-                    displayName=self.table_name,
-                )
+            ref = "%s:%s" % (
+                self._first_header_cell.coordinate,
+                self._last_data_cell.coordinate if self._last_data_cell
+                else "{0}{1}".format(self._last_header_cell.column, self._last_header_cell.row + 1)
             )
+            if self.workbook.write_only:
+                # Write only worksheets cannot serialize tables, fall back on filtering the same range.
+                worksheet.auto_filter.ref = ref
+            else:
+                worksheet.add_table(Table(ref=ref, displayName=self.table_name))
 
-        # Freeze pane
-        if self.freeze_header:
-            row = (self._first_data_cell or self._first_header_cell).row
-        else:
-            row = 1
-        try:
-            column = next(column.column_index for column in self.columns if column.freeze)
-        except StopIteration:
-            column = 0
-        if row + column > 1:
-            worksheet.freeze_panes = worksheet["%s%s" % (get_column_letter(column+1), row)]
+        if not self.workbook.write_only:
+            self.freeze_panes(worksheet, first_row=first_row)
 
         # Print titles
         if self.print_title_rows:
@@ -326,80 +730,453 @@ class TableSheet(TemplatedWorksheet):
             else:
                 print_title_columns = "1:1"
             worksheet.print_title_columns = print_title_columns
+        refresh_print_titles(worksheet)
 
-        # Grouping
-        groups = groupby(self.columns, lambda col: col.group)
-        for columns in (list(columns) for group, columns in groups if group):
-            worksheet.column_dimensions.group(
-                start=columns[0].column_letter,
-                end=columns[-1].column_letter,
-                outline_level=1,
-                hidden=columns[0].hidden
-            )
+    def freeze_panes(self, worksheet, first_row):
+        if self.freeze_header:
+            row = first_row
+        else:
+            row = 1
+        try:
+            column = next(column.column_index for column in self.columns if column.freeze)
+        except StopIteration:
+            column = 0
+        if row + column > 1:
+            worksheet.freeze_panes = "%s%s" % (get_column_letter(column+1), row)
+
+    def read(self, exception_policy=None, look_for_headers=None, columns=None, where=None):
+        """
+        Read the rows of the sheet. If `columns`, a sequence of columns or their object attributes, is given only
+        those columns are read and the rows only contain their values. `where` maps columns, or their object
+        attributes, to a predicate or a value. Only rows whose cell values pass the predicates, or equal the
+        values, are converted and returned. The cell values are tested as read from the sheet, before conversion.
+        """
+        exception_policy = exception_policy if exception_policy is not None else self.exception_policy
+        timings = self._start_timings("read")
+
+        if columns is not None:
+            columns = self._resolve_columns(columns)
+
+        def compile_decode():
+            if timings is not None and type(self).object_from_values is TableSheet.object_from_values:
+                # Compiled again to time each column, the cached decoders stay untimed.
+                decode_values = self._compile_row_decoder(columns, timings=timings)
+            elif columns is None:
+                def decode(values, row_number):
+                    return self.object_from_values(values, row_number, exception_policy=exception_policy)
+                return decode
+            else:
+                decode_values = self._projection_decoder(columns)
 
-        if self.hide_excess_columns:
-            worksheet.column_dimensions.group(
-                start=get_column_letter(len(self.columns) + 1),
-                end=get_column_letter(MAX_COLUMN_INDEX + 1),
-                outline_level=0,
-                hidden=True
-            )
+            def decode(values, row_number):
+                return decode_values(values, row_number, exception_policy)
+            return decode
 
-    def read(self, exception_policy=None, look_for_headers=None):
-        header_found = not (look_for_headers if look_for_headers is not None else self.look_for_headers)
-        _exception_policy = exception_policy if exception_policy is not None else self.exception_policy
+        return self._read(
+            self._iter_rows(look_for_headers, columns, where), compile_decode, exception_policy, timings
+        )
 
-        rows = self.worksheet.__iter__()
-        row_number = 0
-        try:
-            while not header_found:
-                row_number += 1
-                header_found = self._is_row_header(next(rows))
+    def aread(self, exception_policy=None, look_for_headers=None, columns=None, where=None, batch_size=1000,
+              executor=None):
+        """
+        Async generator yielding the objects of `read`. Batches of `batch_size` rows are read and converted in
+        `executor`, the default executor of the event loop if None.
+        """
+        from openpyxl_templates import aio
+        return aio.read(
+            self, batch_size=batch_size, executor=executor, exception_policy=exception_policy,
+            look_for_headers=look_for_headers, columns=columns, where=where
+        )
 
-            row_exceptions = []
-            while True:
-                row_number += 1
+    def read_parallel(self, workers=None, chunk_size=1000, exception_policy=None, look_for_headers=None, where=None):
+        """
+        Read the sheet like `read`, converting chunks of `chunk_size` rows in up to `workers` forked processes.
+        The objects are yielded in the order of the rows and exceptions are handled according to the exception
+        policy exactly as when reading serially. Converted values must be picklable.
+        """
+        exception_policy = exception_policy if exception_policy is not None else self.exception_policy
+
+        from openpyxl_templates import parallel
+        if not parallel.fork_available() or workers == 1:
+            return self.read(exception_policy=exception_policy, look_for_headers=look_for_headers, where=where)
+
+        create_object = self.object_factory
+
+        def decode(result, row_number):
+            row, exception = result
+            if exception is not None:
+                raise exception
+            return create_object(row_number, row)
+
+        return self._read(
+            parallel.convert_rows(
+                self, self._iter_rows(look_for_headers, where=where), exception_policy, workers=workers,
+                chunk_size=chunk_size
+            ),
+            lambda: decode,
+            exception_policy,
+            self._start_timings("read_parallel")
+        )
+
+    def read_columns(self, exception_policy=None, look_for_headers=None, batch_size=10000, columns=None,
+                     where=None):
+        """
+        Read the sheet column by column, returning an OrderedDict mapping the object attribute of each column to the
+        values of all rows. The values are NumPy arrays of the dtype of the column when NumPy is installed and lists
+        otherwise. Batches of `batch_size` rows are converted one column at a time, in one pass where the column
+        supports it. Invalid rows are handled according to the exception policy. `columns` and `where` select
+        columns and rows as for `read`.
+        """
+        exception_policy = exception_policy if exception_policy is not None else self.exception_policy
+        timings = self._start_timings("read_columns")
+        if columns is not None:
+            columns = self._resolve_columns(columns)
+        rows = self._iter_rows(look_for_headers, columns, where)
+        columns = columns or self.columns
+        width = len(columns)
+        padding = (None,) * width
+        batch_decoders = tuple(column.compile_batch_decoder() for column in columns)
+        decode_columns = tuple(
+            (timings.column(column.header).timed("from_excel", self._decode_batch) if timings is not None
+             else self._decode_batch)
+            for column in columns
+        )
+        if timings is not None:
+            rows = timings.timed_iter("iter_rows", rows)
+
+        batches = [[] for column in columns]
+        row_exceptions = []
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            if timings is not None:
+                timings.rows += len(batch)
+            decode_start = default_timer()
+
+            row_numbers = [row_number for row_number, values in batch]
+            columns_values = islice(zip(*(tuple(values) + padding for row_number, values in batch)), width)
+
+            cell_exceptions = defaultdict(list)
+            arrays = [
+                decode_column(column, decode_batch, values, row_numbers, cell_exceptions)
+                for column, decode_batch, decode_column, values
+                in zip(columns, batch_decoders, decode_columns, columns_values)
+            ]
+
+            if cell_exceptions:
+                invalid_rows = sorted(cell_exceptions)
+                if exception_policy == TableSheetExceptionPolicy.RaiseCellException:
+                    raise cell_exceptions[invalid_rows[0]][0]
+                if exception_policy == TableSheetExceptionPolicy.RaiseRowException:
+                    raise CellExceptions(cell_exceptions[invalid_rows[0]], row_number=row_numbers[invalid_rows[0]])
+                row_exceptions.extend(
+                    CellExceptions(cell_exceptions[index], row_number=row_numbers[index]) for index in invalid_rows
+                )
+                arrays = [self._drop_rows(array, invalid_rows) for array in arrays]
+
+            for column_batches, array in zip(batches, arrays):
+                column_batches.append(array)
+            if timings is not None:
+                timings.add("decode", default_timer() - decode_start)
+
+        self._finish_timings(timings)
+
+        if row_exceptions and exception_policy == TableSheetExceptionPolicy.RaiseSheetException:
+            raise RowExceptions(row_exceptions)
+
+        return OrderedDict(
+            (column.object_attribute, self._concatenate(column, column_batches))
+            for column, column_batches in zip(columns, batches)
+        )
+
+    def _decode_batch(self, column, decode_batch, values, row_numbers, cell_exceptions):
+        array = decode_batch(values) if decode_batch else None
+        if array is None:
+            array = column.as_array(self._decode_column(column, values, row_numbers, cell_exceptions))
+        return array
+
+    def _decode_column(self, column, values, row_numbers, cell_exceptions):
+        decode = column.compile_decoder()
+        cell = self._value_cell(column)
+        result = []
+        for index, (value, row_number) in enumerate(zip(values, row_numbers)):
+            cell.value = value
+            cell.row = row_number
+            try:
+                result.append(decode(cell))
+            except CellException as e:
+                e.coordinate = cell.coordinate
+                cell_exceptions[index].append(e)
+                result.append(None)
+        return result
+
+    @staticmethod
+    def _drop_rows(array, indexes):
+        if isinstance(array, list):
+            indexes = set(indexes)
+            return [value for index, value in enumerate(array) if index not in indexes]
+        return numpy.delete(array, indexes)
+
+    @staticmethod
+    def _concatenate(column, batches):
+        if not batches:
+            return column.as_array([])
+        if isinstance(batches[0], list):
+            return list(chain.from_iterable(batches))
+        return numpy.concatenate(batches)
+
+    def _read(self, rows, compile_decode, exception_policy, timings=None):
+        # The decoder is compiled once the first row is read, when the columns of the sheet have been located.
+        if timings is not None:
+            rows = timings.timed_iter("iter_rows", rows)
+
+        decode = None
+        row_exceptions = []
+        try:
+            for row_number, row in rows:
+                if decode is None:
+                    decode = compile_decode()
+                    if timings is not None:
+                        decode = timings.timed("decode", decode, count_rows=True)
                 try:
-                    yield self.object_from_row(next(rows), row_number, exception_policy=_exception_policy)
+                    yield decode(row, row_number)
                 except CellExceptions as e:
-                    if _exception_policy.value <= TableSheetExceptionPolicy.RaiseRowException.value:
+                    if exception_policy.value <= TableSheetExceptionPolicy.RaiseRowException.value:
                         raise e
-                    else:
-                        row_exceptions.append(e)
+                    row_exceptions.append(e)
                 except IgnoreRow:
                     continue
+        finally:
+            self._finish_timings(timings)
 
-                if row_exceptions and _exception_policy.value <= TableSheetExceptionPolicy.RaiseSheetException.value:
-                    raise RowExceptions(row_exceptions)
-        except StopIteration:
+        if row_exceptions and exception_policy == TableSheetExceptionPolicy.RaiseSheetException:
+            raise RowExceptions(row_exceptions)
+
+    def _iter_rows(self, look_for_headers=None, columns=None, where=None):
+        if not where:
+            return self._iter_data_values(look_for_headers, columns=columns)
+
+        read_columns, test = self._compile_where(where, columns)
+        return (
+            (row_number, values)
+            for row_number, values in self._iter_data_values(look_for_headers, columns=read_columns)
+            if test(values)
+        )
+
+    def _compile_where(self, where, columns=None):
+        # The columns to read, with those only needed by the predicates last, and the test of their values.
+        read_columns = list(columns if columns is not None else self.columns)
+        tests = []
+        for key, predicate in where.items():
+            column = self._resolve_columns((key,))[0]
+            if column not in read_columns:
+                read_columns.append(column)
+            if not callable(predicate):
+                predicate = partial(eq, predicate)
+            tests.append((read_columns.index(column), predicate))
+
+        def test(values):
+            for index, predicate in tests:
+                if not predicate(values[index] if index < len(values) else None):
+                    return False
+            return True
+
+        return (tuple(read_columns) if columns is not None else None), test
+
+    def _iter_data_values(self, look_for_headers=None, columns=None):
+        rows = enumerate(self.iter_values(), start=1)
+        if look_for_headers if look_for_headers is not None else self.look_for_headers:
+            header_row, positions = self._locate_headers(rows)
+            self._locate_columns(positions)
+        elif columns is None:
+            self._locate_columns(None)
+            for row in rows:
+                yield row
+            return
+        else:
+            header_row, positions = 0, self.header_locator.identity
+            self._locate_columns(None)
+
+        if columns is not None:
+            positions = tuple(positions[column.column_index - 1] for column in columns)
+
+        # Continue below the header with only the cells in the span of the columns found, where the worksheet
+        # allows it, cells in other columns are then never parsed or created.
+        first_position = min(positions)
+        bounded_values = self.iter_values(
+            min_row=header_row + 1,
+            min_col=first_position + 1,
+            max_col=max(positions) + 1
+        )
+        if bounded_values is not None:
+            rows = enumerate(bounded_values, start=header_row + 1)
+            positions = tuple(position - first_position for position in positions)
+
+        if positions == tuple(range(len(positions))):
+            for row in rows:
+                yield row
+            return
+
+        # Map the columns of the sheet onto the columns of the TableSheet.
+        get_values = itemgetter(*positions) if len(positions) > 1 else lambda values: (values[positions[0]],)
+        padding = (None,) * (max(positions) + 1)
+        for row_number, values in rows:
+            try:
+                yield row_number, get_values(values)
+            except IndexError:
+                yield row_number, get_values(tuple(values) + padding)
+
+    def _locate_columns(self, positions):
+        # Cells read from other columns of the sheet than declared report their coordinates in exceptions, the
+        # cached decoders are compiled again with the new letters.
+        letters = tuple(get_column_letter(position + 1) for position in positions) if positions else None
+        if letters == self.layout.letters:
+            letters = None
+        if letters != self._column_letters:
+            self._column_letters = letters
+            self._row_decoder = None
+            self._row_converter = None
+            self._projections = None
+
+    def _value_cell(self, column):
+        column_letters = self._column_letters
+        return ValueCell(
+            None, 0, column_letters[column.column_index - 1] if column_letters else column.column_letter
+        )
+
+    def column_positions(self):
+        """
+        OrderedDict mapping each column to the index of the column of the sheet it is read from, as given by the
+        position of its header.
+        """
+        header_row, positions = self._locate_headers(enumerate(self.iter_values(), start=1))
+        return OrderedDict((column, position + 1) for column, position in zip(self.columns, positions))
+
+    def _locate_headers(self, rows):
+        # Consumes rows up to and including the header row.
+        match = self.header_locator.match
+        scan_limit = self.header_scan_limit
+        for row_number, values in rows:
+            positions = match(values)
+            if positions is not None:
+                return row_number, positions
+            if scan_limit is not None and row_number >= scan_limit:
+                break
+
+        raise HeadersNotFound(self)
+
+    @property
+    def header_locator(self):
+        if self._header_locator is None or self._header_locator.header_matching != self.header_matching:
+            self._header_locator = HeaderLocator(self.layout.headers, self.header_matching)
+        return self._header_locator
+
+    def iter_values(self, min_row=None, min_col=None, max_col=None):
+        """
+        The values of the rows of the worksheet. When bounds are given the rows are limited to them, or None is
+        returned if the worksheet cannot be iterated within bounds.
+        """
+        worksheet = self.worksheet
+        bounds = dict(min_row=min_row, min_col=min_col, max_col=max_col)
+        try:
+            return worksheet.iter_rows(values_only=True, **bounds)
+        except (AttributeError, TypeError):
             pass
 
-        if not header_found:
-            raise HeadersNotFound(self)
+        # Older versions of openpyxl only provide cells, plain iterables of rows cannot be bounded.
+        if hasattr(worksheet, "iter_rows"):
+            rows = worksheet.iter_rows(**bounds)
+        elif not any(bounds.values()):
+            rows = worksheet
+        else:
+            return None
+        return (tuple(cell.value for cell in row) for row in rows)
 
-    def _is_row_header(self, row):
-        for cell, header in zip(chain(row, repeat(None)), self.headers):
-            if str(cell.value) != header:
-                return False
-        return True
+    def _is_row_header(self, values):
+        return self.header_locator.match(tuple(values)) is not None
 
     def object_from_row(self, row, row_number, exception_policy=TableSheetExceptionPolicy.RaiseCellException):
-        data = OrderedDict()
-        cell_exceptions = []
-        for cell, column in zip(chain(row, repeat(None)), self.columns):
-            try:
-                data[column.object_attribute] = column._from_excel(cell)
-            except CellException as e:
-                if exception_policy.value <= TableSheetExceptionPolicy.RaiseCellException.value:
-                    raise e
-                else:
+        return self.object_from_values(
+            tuple(cell.value for cell in row),
+            row_number,
+            exception_policy=exception_policy
+        )
+
+    def object_from_values(self, values, row_number,
+                           exception_policy=TableSheetExceptionPolicy.RaiseCellException):
+        return self.row_decoder(values, row_number, exception_policy)
+
+    def _compile_row_decoder(self, columns=None, timings=None):
+        if columns is None:
+            convert = self.row_converter if timings is None else self._compile_row_converter(timings=timings)
+            create_object = self.object_factory
+        else:
+            convert = self._compile_row_converter(columns, timings=timings)
+            create_object = self._object_factory(columns, self._compile_row_class(columns))
+
+        def decode(values, row_number, exception_policy=TableSheetExceptionPolicy.RaiseCellException):
+            return create_object(row_number, convert(values, row_number, exception_policy))
+
+        return decode
+
+    def _compile_row_converter(self, columns=None, timings=None):
+        columns = columns or self.columns
+        cells = tuple(self._value_cell(column) for column in columns)
+        converters = tuple(column.compile_decoder() for column in columns)
+        if timings is not None:
+            converters = tuple(
+                timings.column(column.header).timed("from_excel", converter)
+                for column, converter in zip(columns, converters)
+            )
+        padding = repeat(None)
+
+        def convert(values, row_number, exception_policy=TableSheetExceptionPolicy.RaiseCellException):
+            # The cells are reused between rows, exceptions record the coordinate when raised.
+            row = []
+            if exception_policy.value <= TableSheetExceptionPolicy.RaiseCellException.value:
+                for value, cell, convert_cell in zip(chain(values, padding), cells, converters):
+                    cell.value = value
+                    cell.row = row_number
+                    try:
+                        row.append(convert_cell(cell))
+                    except CellException as e:
+                        e.coordinate = cell.coordinate
+                        raise
+                return row
+
+            cell_exceptions = []
+            for value, cell, convert_cell in zip(chain(values, padding), cells, converters):
+                cell.value = value
+                cell.row = row_number
+                try:
+                    row.append(convert_cell(cell))
+                except CellException as e:
+                    e.coordinate = cell.coordinate
                     cell_exceptions.append(e)
 
-        if cell_exceptions:
-            raise CellExceptions(cell_exceptions)
+            if cell_exceptions:
+                raise CellExceptions(cell_exceptions, row_number=row_number)
+
+            return row
+
+        return convert
+
+    @property
+    def object_factory(self):
+        return self._object_factory(self.columns, self.row_class)
+
+    def _object_factory(self, columns, row_class):
+        if type(self).create_object is TableSheet.create_object:
+            def create_object(row_number, row):
+                return tuple.__new__(row_class, row)
+        else:
+            object_attributes = tuple(column.object_attribute for column in columns)
 
-        # return self.row_class(**data)
-        return self.create_object(row_number, **data)
+            def create_object(row_number, row):
+                return self.create_object(row_number, **dict(zip(object_attributes, row)))
+
+        return create_object
 
     def create_object(self, row_number, **data):
         return self.row_class(**data)
@@ -420,17 +1197,66 @@ class TableSheet(TemplatedWorksheet):
 
     @property
     def headers(self):
-        return (column.header for column in self.columns)
+        return self.layout.headers
+
+    @property
+    def layout(self):
+        """
+        The TableSheetLayout of the columns, shared by reading and writing until a column is added.
+        """
+        if self._layout is None:
+            self._layout = TableSheetLayout(self.columns)
+        return self._layout
+
+    @property
+    def styles(self):
+        if self._column_styles is None:
+            self._column_styles = frozenset(chain.from_iterable(column.styles for column in self.columns))
+        return tuple(self._column_styles.union((self.title_style, self.description_style)) - {None})
+
+    @property
+    def row_decoder(self):
+        if not self._row_decoder:
+            self._row_decoder = self._compile_row_decoder()
+        return self._row_decoder
+
+    @property
+    def row_converter(self):
+        if not self._row_converter:
+            self._row_converter = self._compile_row_converter()
+        return self._row_converter
 
     @property
     def row_class(self):
         if not self._row_class:
-            self._row_class = namedtuple(
-                "%sRow" % self.__class__.__name__,
-                (column.object_attribute for column in self.columns)
-            )
+            self._row_class = self._compile_row_class(self.columns)
         return self._row_class
 
+    def _compile_row_class(self, columns):
+        return namedtuple("%sRow" % self.__class__.__name__, (column.object_attribute for column in columns))
+
+    def _projection_decoder(self, columns):
+        # Decoders of column subsets are cached, the row class of a projection is the same between reads.
+        if self._projections is None:
+            self._projections = {}
+        try:
+            return self._projections[columns]
+        except KeyError:
+            decoder = self._projections[columns] = self._compile_row_decoder(columns)
+            return decoder
+
+    def _resolve_columns(self, columns):
+        by_attribute = {column.object_attribute: column for column in self.columns}
+        resolved = []
+        for column in columns:
+            if column in self.columns:
+                resolved.append(column)
+            elif column in by_attribute:
+                resolved.append(by_attribute[column])
+            else:
+                raise ColumnNotFound(self, column)
+        return tuple(resolved)
+
     def __iter__(self):
         return self.read()
 
@@ -1,7 +1,5 @@
-from future.utils import with_metaclass
-
 from openpyxl_templates.exceptions import OpenpyxlTemplateException
-from openpyxl_templates.utils import OrderedType, Typed
+from openpyxl_templates.utils import OrderedType, Typed, with_metaclass
 
 
 class TemplatedWorkbookNotSet(OpenpyxlTemplateException):
@@ -30,6 +28,7 @@ class TemplatedWorksheet(with_metaclass(OrderedType)):
     active = Typed("active", expected_type=bool, value=False)
     _workbook = None
     template_styles = None
+    stats = None
 
     # order = ... # TODO: Add ordering to sheets either through declaration on workbook or here
 
@@ -46,6 +45,12 @@ class TemplatedWorksheet(with_metaclass(OrderedType)):
         if not self.exists:
             return True
 
+        if self.workbook.write_only:
+            return not self.worksheet._max_row
+
+        if self.workbook.read_only:
+            return not any(True for row in self.worksheet.iter_rows(max_row=1))
+
         return not bool(len(self.worksheet._cells))
 
     @property
@@ -72,6 +77,10 @@ class TemplatedWorksheet(with_metaclass(OrderedType)):
         except ValueError:
             raise WorksheetDoesNotExist(self)
 
+    @property
+    def styles(self):
+        return ()
+
     def write(self, data):
         raise NotImplemented()
         # 'self.sheet_template.write(self.worksheet, self.templated_workbook.styles, data)
@@ -1,14 +1,13 @@
 from datetime import datetime
+from io import BytesIO
 
 from openpyxl import Workbook, load_workbook
-from openpyxl.writer.excel import save_virtual_workbook
 
+from openpyxl_templates import profiling
 from openpyxl_templates.exceptions import OpenpyxlTemplateException
-from openpyxl_templates.styles import DefaultStyleSet, StyleSet
+from openpyxl_templates.styles import StyleSet, default_style_set
 from openpyxl_templates.templated_sheet import TemplatedWorksheet
-from openpyxl_templates.utils import OrderedType, Typed
-
-from future.utils import with_metaclass
+from openpyxl_templates.utils import OrderedType, Typed, with_metaclass
 
 
 class SheetnamesNotUnique(OpenpyxlTemplateException):
@@ -23,6 +22,20 @@ class MultipleActiveSheets(OpenpyxlTemplateException):
             "The TemplatedWorkbook '%s' has multiple active sheets." % type(templated_workbook).__name__)
 
 
+class WriteOnlyWorkbookFromFile(OpenpyxlTemplateException):
+    def __init__(self, templated_workbook):
+        super(WriteOnlyWorkbookFromFile, self).__init__(
+            "The TemplatedWorkbook '%s' cannot be loaded from a file in write only mode." %
+            type(templated_workbook).__name__)
+
+
+class ParallelWriteRequiresWriteOnly(OpenpyxlTemplateException):
+    def __init__(self, templated_workbook):
+        super(ParallelWriteRequiresWriteOnly, self).__init__(
+            "The TemplatedWorkbook '%s' can only write sheets in parallel in write only mode." %
+            type(templated_workbook).__name__)
+
+
 class TemplatedWorkbook(with_metaclass(OrderedType)):
     item_class = TemplatedWorksheet
 
@@ -34,6 +47,7 @@ class TemplatedWorkbook(with_metaclass(OrderedType)):
     _file_extension = "xlsx"
 
     workbook = Typed("workbook", expected_type=Workbook)
+    stats = Typed("stats", expected_type=profiling.Stats, allow_none=True)
 
     # def __new__(cls, *args, file=None, **kwargs):
     #     if file:
@@ -41,18 +55,23 @@ class TemplatedWorkbook(with_metaclass(OrderedType)):
     #     return super().__new__(cls)
 
     def __init__(self, file=None, template_styles=None, timestamp=None, templated_sheets=None, keep_vba=False,
-                  data_only=False, keep_links=True):
+                  data_only=False, keep_links=True, write_only=False, read_only=False, stats=None):
         super(TemplatedWorkbook, self).__init__()
 
+        if file and write_only:
+            raise WriteOnlyWorkbookFromFile(self)
+
         self.workbook = load_workbook(
             filename=file,
+            read_only=read_only,
             data_only=data_only,
             keep_vba=keep_vba,
             keep_links=keep_links
-        ) if file else Workbook()
+        ) if file else Workbook(write_only=write_only)
 
-        self.template_styles = template_styles or DefaultStyleSet()
+        self.template_styles = template_styles or default_style_set()
         self.timestamp = timestamp
+        self.stats = stats
 
         self.templated_sheets = []
         for sheetname, templated_sheet in self._items.items():
@@ -82,6 +101,7 @@ class TemplatedWorkbook(with_metaclass(OrderedType)):
 
         sheet.workbook = self.workbook
         sheet.template_styles = self.template_styles
+        sheet.stats = self.stats
         self.templated_sheets.append(sheet)
 
         return sheet
@@ -90,6 +110,39 @@ class TemplatedWorkbook(with_metaclass(OrderedType)):
         # if add_to_self:
         #     setattr(self, sheet.sheetname, sheet)
 
+    @property
+    def write_only(self):
+        return self.workbook.write_only
+
+    @property
+    def read_only(self):
+        return self.workbook.read_only
+
+    def write_parallel(self, sheets, processes=None):
+        """
+        Write several sheets at once, each in its own worker process. `sheets` maps templated sheets to the keyword
+        arguments of their write method. If `objects` is callable it is called in the worker, which is where
+        querysets and other lazy iterables should be evaluated.
+        """
+        if not self.write_only:
+            raise ParallelWriteRequiresWriteOnly(self)
+
+        from openpyxl_templates import parallel
+
+        jobs = list(sheets.items())
+        for templated_sheet, kwargs in jobs:
+            templated_sheet.remove()
+
+        if not parallel.fork_available() or processes == 1:
+            for templated_sheet, kwargs in jobs:
+                kwargs = dict(kwargs)
+                if callable(kwargs.get("objects")):
+                    kwargs["objects"] = kwargs["objects"]()
+                templated_sheet.write(**kwargs)
+            return
+
+        parallel.write_sheets(self.workbook, jobs, processes=processes)
+
     def remove_all_sheets(self):
         for sheetname in self.workbook.sheetnames:
             del self.workbook[sheetname]
@@ -99,14 +152,48 @@ class TemplatedWorkbook(with_metaclass(OrderedType)):
             filename = self.timestamp_filename(filename)
 
         self.sort_worksheets()
-
-        self.workbook.save(filename)
+        self._save_to_stream(filename)
 
         return filename
 
-    def save_virtual_workbook(self):
+    def save_to_stream(self, fileobj):
+        """
+        Write the workbook into a writable file object, such as a response body or a socket. The file object does
+        not need to be seekable and write only worksheets are copied into it in chunks.
+        """
         self.sort_worksheets()
-        return save_virtual_workbook(self.workbook)
+        self._save_to_stream(fileobj)
+
+    def _save_to_stream(self, fileobj):
+        from openpyxl_templates import writer
+        if self.stats is None:
+            return writer.save_to_stream(self.workbook, fileobj)
+
+        timings = self.stats.start("save")
+        with timings.phase("serialize"):
+            writer.save_to_stream(self.workbook, fileobj)
+        self.stats.finish(timings)
+
+    def iter_chunks(self, chunk_size=1 << 16):
+        """
+        Generator yielding the saved workbook in chunks of about `chunk_size` bytes, for streaming responses. The
+        workbook is written in a separate thread as the chunks are consumed.
+        """
+        self.sort_worksheets()
+        from openpyxl_templates import writer
+        return writer.iter_chunks(self.workbook, chunk_size=chunk_size)
+
+    def asave(self, filename, executor=None):
+        """
+        Coroutine saving the workbook in `executor`, the default executor of the event loop if None.
+        """
+        from openpyxl_templates import aio
+        return aio.save(self, filename, executor=executor)
+
+    def save_virtual_workbook(self):
+        stream = BytesIO()
+        self.save_to_stream(stream)
+        return stream.getvalue()
 
     def sort_worksheets(self):
         order = {}
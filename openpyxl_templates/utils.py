@@ -1,11 +1,11 @@
 from collections import OrderedDict
-from weakref import WeakKeyDictionary
 
 from openpyxl.styles import Border
 from openpyxl.styles import Side
 from openpyxl.styles.borders import BORDER_MEDIUM
 from openpyxl.styles.fills import FILL_SOLID, PatternFill
 from openpyxl.utils import column_index_from_string
+from openpyxl.worksheet import Worksheet
 
 MAX_COLUMN_INDEX = column_index_from_string("XFD")
 
@@ -38,14 +38,36 @@ def ColoredBorders(color, top=True, right=True, bottom=True, left=True):
     )
 
 
+def refresh_print_titles(worksheet):
+    """
+    Write only worksheets of openpyxl 2.4 read their print titles once, when created. Update them after setting
+    the print title rows or columns.
+    """
+    if "print_titles" in vars(worksheet):
+        worksheet.print_titles = Worksheet.print_titles.__get__(worksheet)
+
+
+def coalesce_ranges(ranges):
+    """Sort and merge overlapping or adjacent (first, last) ranges of integers."""
+    coalesced = []
+    for first, last in sorted(ranges):
+        if coalesced and first <= coalesced[-1][1] + 1:
+            if last > coalesced[-1][1]:
+                coalesced[-1] = (coalesced[-1][0], last)
+        else:
+            coalesced.append((first, last))
+    return coalesced
+
+
 class Typed(object):
     name = None
     default_value = None
-    _values = None
+    _key = None
 
     def __init__(self, name, value=None, expected_type=None, expected_types=None, allow_none=False):
         self.name = name
-        self._values = WeakKeyDictionary()
+        # Values are stored on the instance, under the attribute name once known (see __set_name__).
+        self._key = "_typed_%s" % name
 
         if expected_types is not None:
             self.expected_types = expected_types
@@ -61,6 +83,10 @@ class Typed(object):
             self.validate(value)
             self.default_value = value
 
+    def __set_name__(self, owner, name):
+        # Typed is a data descriptor, an instance attribute of the same name can never shadow it.
+        self._key = name
+
     def __set__(self, instance, value):
         if instance is None:
             return
@@ -68,13 +94,10 @@ class Typed(object):
         self.validate(value)
 
         if value is None:
-            try:
-                del self._values[instance]
-            except KeyError:
-                pass
+            instance.__dict__.pop(self._key, None)
             return
 
-        self._values[instance] = value
+        instance.__dict__[self._key] = value
 
     def validate(self, value):
         if value is None:
@@ -88,12 +111,9 @@ class Typed(object):
                 self.name, type(value), str(self.expected_types)))
 
     def __get__(self, instance, owner):
-        if instance is not None:
-            try:
-                return self._values[instance]
-            except KeyError:
-                pass
-        return self.default_value
+        if instance is None:
+            return self.default_value
+        return instance.__dict__.get(self._key, self.default_value)
 
     def __repr__(self):
         return self.__doc__
@@ -104,6 +124,21 @@ class class_property(classmethod):
         return super(class_property, self).__get__(instance, owner)()
 
 
+def with_metaclass(metaclass, *bases):
+    """
+    Base class creating the class with metaclass, keeping the metaclass out of the bases of the class.
+    """
+    class temporary_metaclass(metaclass):
+        def __new__(mcs, name, this_bases, classdict):
+            return metaclass(name, bases, classdict)
+
+        @classmethod
+        def __prepare__(mcs, name, this_bases):
+            return metaclass.__prepare__(name, bases)
+
+    return type.__new__(temporary_metaclass, "temporary_class", (), {})
+
+
 class OrderedType(type):
     item_class = None
     _items = None
@@ -133,6 +168,20 @@ class OrderedType(type):
         return obj
 
 
+class ValueCell(object):
+    """Lightweight stand-in for a cell when only the values of a worksheet are read."""
+    __slots__ = ("value", "row", "column_letter")
+
+    def __init__(self, value, row, column_letter):
+        self.value = value
+        self.row = row
+        self.column_letter = column_letter
+
+    @property
+    def coordinate(self):
+        return "%s%d" % (self.column_letter, self.row)
+
+
 class FakeCell:
     coordinate = "A1"
 
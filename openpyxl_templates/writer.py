@@ -0,0 +1,200 @@
+import threading
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import get_rels_path, Relationship
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.writer.worksheet import write_conditional_formatting
+from openpyxl.writer.write_only import WriteOnlyWorksheet
+from openpyxl.xml.functions import tostring
+
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
+
+
+_CHUNK_SIZE = 1 << 20
+
+# The elements a write only worksheet may write after sheetData which come after conditionalFormatting.
+_AFTER_CONDITIONAL_FORMATTING = (b"<dataValidations", b"<drawing", b"<legacyDrawing", b"</worksheet>")
+
+
+class StreamingExcelWriter(ExcelWriter):
+    """
+    ExcelWriter copying write only worksheets into the archive from their temporary files in chunks, rather than
+    reading each of them into memory first. Write only worksheets of openpyxl 2.4 do not serialize their
+    conditional formatting, it is inserted while copying.
+    """
+
+    def _write_worksheets(self):
+        # Follows ExcelWriter._write_worksheets apart from how the worksheet itself is written.
+        for idx, ws in enumerate(self.workbook.worksheets, 1):
+
+            ws._id = idx
+            if isinstance(ws, WriteOnlyWorksheet):
+                self._copy_write_only_worksheet(ws)
+            else:
+                self._archive.writestr(ws.path[1:], ws._write())
+            rels_path = get_rels_path(ws.path)[1:]
+            self.manifest.append(ws)
+
+            if ws._drawing:
+                self._write_drawing(ws._drawing)
+
+                for r in ws._rels.Relationship:
+                    if "drawing" in r.Type:
+                        r.Target = ws._drawing.path
+
+            if ws._comments:
+                self._write_comment(ws)
+
+            if ws.legacy_drawing is not None:
+                shape_rel = Relationship(type="vmlDrawing", Id="anysvml",
+                                         Target="/" + ws.legacy_drawing)
+                ws._rels.append(shape_rel)
+
+            for t in ws._tables:
+                self._tables.append(t)
+                t.id = len(self._tables)
+                t._write(self._archive)
+                self.manifest.append(t)
+                ws._rels[t._rel_id].Target = t.path
+
+            if ws._rels:
+                tree = ws._rels.to_tree()
+                self._archive.writestr(rels_path, tostring(tree))
+
+    def _copy_write_only_worksheet(self, ws):
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        ws.close()
+        conditional_formatting = b"".join(tostring(tree) for tree in write_conditional_formatting(ws))
+        if conditional_formatting:
+            with open(ws.filename, "rb") as src, self._archive.open(ws.path[1:], "w", force_zip64=True) as dst:
+                _copy_inserting(src, dst, conditional_formatting, _AFTER_CONDITIONAL_FORMATTING)
+        else:
+            self._archive.write(ws.filename, ws.path[1:])
+        ws._cleanup()
+
+
+def _copy_inserting(src, dst, data, before):
+    # Copy src to dst in chunks, inserting data before the first occurrence of any of the markers in before. Cell
+    # values are escaped, the markers can only be found as elements.
+    overlap = max(len(marker) for marker in before) - 1
+    pending = b""
+    while True:
+        chunk = src.read(_CHUNK_SIZE)
+        pending += chunk
+        positions = [position for position in (pending.find(marker) for marker in before) if position >= 0]
+        if positions:
+            position = min(positions)
+            dst.write(pending[:position])
+            dst.write(data)
+            dst.write(pending[position:])
+            break
+        if not chunk:
+            raise ValueError("Unable to place the conditional formatting in the worksheet.")
+        dst.write(pending[:-overlap])
+        pending = pending[-overlap:]
+
+    while True:
+        chunk = src.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        dst.write(chunk)
+
+
+def save_to_stream(workbook, fileobj):
+    """
+    Write the workbook as an xlsx file into the writable file object `fileobj`, which does not have to be seekable.
+    """
+    if workbook.read_only:
+        raise TypeError("Workbook is read-only")
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+
+    archive = ZipFile(fileobj, 'w', ZIP_DEFLATED, allowZip64=True)
+    writer = StreamingExcelWriter(workbook, archive)
+    try:
+        writer.write_data()
+    finally:
+        archive.close()
+
+
+def iter_chunks(workbook, chunk_size=1 << 16, max_chunks=4):
+    """
+    Generator yielding the xlsx file of the workbook in chunks of about `chunk_size` bytes. The file is written in a
+    separate thread which is at most `max_chunks` chunks ahead of the consumer.
+    """
+    stream = _ChunkStream(chunk_size, Queue(maxsize=max_chunks))
+
+    def write():
+        try:
+            save_to_stream(workbook, stream)
+            stream.flush()
+            stream.put((None, None))
+        except _StreamClosed:
+            pass
+        except BaseException as e:
+            try:
+                stream.put((None, e))
+            except _StreamClosed:
+                pass
+
+    thread = threading.Thread(target=write, name="openpyxl_templates.iter_chunks")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            chunk, exception = stream.queue.get()
+            if exception is not None:
+                raise exception
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        # The writer gives up at its next write if the consumer stopped early, even while waiting on a full queue.
+        stream.closed_by_reader = True
+        thread.join()
+
+
+class _StreamClosed(Exception):
+    pass
+
+
+class _ChunkStream(object):
+    # Unseekable file object handing the bytes written to it to a queue in chunks.
+    closed_by_reader = False
+
+    def __init__(self, chunk_size, queue):
+        self.chunk_size = chunk_size
+        self.queue = queue
+        self.buffer = []
+        self.size = 0
+
+    def write(self, data):
+        if self.closed_by_reader:
+            raise _StreamClosed()
+        self.buffer.append(bytes(data))
+        self.size += len(data)
+        if self.size >= self.chunk_size:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self.put((b"".join(self.buffer), None))
+            self.buffer = []
+            self.size = 0
+
+    def put(self, item):
+        while True:
+            if self.closed_by_reader:
+                raise _StreamClosed()
+            try:
+                self.queue.put(item, timeout=0.01)
+                return
+            except Full:
+                pass
@@ -14,7 +14,7 @@ import sys
 # Check rst
 # python setup.py check --restructuredtext
 # python setup.py bdist_wheel
-# twine upload dist/openpyxl_templates-X.X.X-py2.py3-none-any.whl
+# twine upload dist/openpyxl_templates-X.X.X-py3-none-any.whl
 
 setup(
     name='openpyxl-templates',
@@ -33,6 +33,7 @@ setup(
         "fortnum"
     ],
     include_package_data=True,
+    python_requires=">=3.6",
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -40,9 +41,11 @@ setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: Implementation :: PyPy',
     ]
 )
\ No newline at end of file
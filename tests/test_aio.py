@@ -0,0 +1,84 @@
+import asyncio
+from os import remove
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from openpyxl_templates.exceptions import CellExceptions, RowExceptions
+from openpyxl_templates.table_sheet import TableSheet, TableColumn
+from openpyxl_templates.table_sheet.columns import IntColumn
+from openpyxl_templates.table_sheet.table_sheet import TableSheetExceptionPolicy
+from openpyxl_templates.templated_workbook import TemplatedWorkbook
+
+
+class TestTemplatedSheet(TableSheet):
+    column1 = TableColumn(header="column1")
+    column2 = IntColumn(header="column2")
+
+
+class TestTemplatedWorkbook(TemplatedWorkbook):
+    sheet1 = TestTemplatedSheet()
+
+
+async def cursor(count):
+    for index in range(count):
+        await asyncio.sleep(0)
+        yield ("row %d" % index, index)
+
+
+async def collect(async_iterable):
+    return [tuple(row) async for row in async_iterable]
+
+
+class AsyncTests(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            self.filename = f.name
+
+    def tearDown(self):
+        self.loop.close()
+        remove(self.filename)
+
+    def test_awrite_aread(self):
+        wb = TestTemplatedWorkbook(write_only=True)
+        self.loop.run_until_complete(wb.sheet1.awrite(cursor(25), title="Title", batch_size=10))
+        self.loop.run_until_complete(wb.asave(self.filename))
+
+        wb = TestTemplatedWorkbook(self.filename)
+        rows = self.loop.run_until_complete(collect(wb.sheet1.aread(batch_size=10)))
+        self.assertEqual(rows, [("row %d" % index, index) for index in range(25)])
+
+    def test_awrite_iterable(self):
+        wb = TestTemplatedWorkbook()
+        self.loop.run_until_complete(wb.sheet1.awrite([("a", 1), ("b", 2)], batch_size=1))
+        self.assertEqual([tuple(row) for row in wb.sheet1.read()], [("a", 1), ("b", 2)])
+
+    def test_awrite_cursor_exception(self):
+        async def failing_cursor():
+            yield ("a", 1)
+            raise ValueError()
+
+        wb = TestTemplatedWorkbook()
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(wb.sheet1.awrite(failing_cursor()))
+
+    def test_aread_exceptions(self):
+        wb = TestTemplatedWorkbook()
+        for row in (("column1", "column2"), ("a", 1), ("b", "invalid"), ("c", 3)):
+            wb.sheet1.worksheet.append(row)
+
+        rows = []
+
+        async def read():
+            async for row in wb.sheet1.aread(
+                    exception_policy=TableSheetExceptionPolicy.RaiseSheetException, batch_size=2):
+                rows.append(tuple(row))
+
+        with self.assertRaises(RowExceptions):
+            self.loop.run_until_complete(read())
+        self.assertEqual(rows, [("a", 1), ("c", 3)])
+
+        with self.assertRaises(CellExceptions):
+            self.loop.run_until_complete(collect(
+                wb.sheet1.aread(exception_policy=TableSheetExceptionPolicy.RaiseRowException, batch_size=5)
+            ))
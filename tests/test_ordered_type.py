@@ -1,8 +1,6 @@
 from unittest import TestCase
 
-from future.utils import with_metaclass
-
-from openpyxl_templates.utils import OrderedType, class_property
+from openpyxl_templates.utils import OrderedType, class_property, with_metaclass
 
 
 class MagicString(str):
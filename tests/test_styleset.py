@@ -21,3 +21,122 @@
 #         self.assertEqual(style.font.bold, True)
 #         self.assertEqual(style.name, "child")
 
+
+from unittest import TestCase
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, NamedStyle
+
+from openpyxl_templates.styles import DefaultStyleSet, ExtendedStyle, FrozenStyleSet, StyleSet, default_style_set
+from openpyxl_templates.templated_workbook import TemplatedWorkbook
+
+
+class StyleSetTests(TestCase):
+    def setUp(self):
+        self.style_set = DefaultStyleSet()
+
+    def test_style_cell(self):
+        wb = Workbook()
+        cell = wb.active["A1"]
+        self.style_set.style_cell(cell, "Row, decimal")
+
+        self.assertEqual(cell.style, "Row, decimal")
+        self.assertEqual(cell.number_format, "0.00")
+
+    def test_style_array_registered_once(self):
+        wb = Workbook()
+        style_array = self.style_set.style_array(wb, "Row")
+
+        self.assertIs(style_array, self.style_set.style_array(wb, "Row"))
+        self.assertEqual(wb.named_styles.count("Row"), 1)
+
+    def test_style_array_per_workbook(self):
+        wb1, wb2 = Workbook(), Workbook()
+        self.style_set.style_array(wb1, "Title")
+
+        for wb in (wb1, wb2):
+            cell = wb.active["A1"]
+            self.style_set.style_cell(cell, "Row")
+            self.assertEqual(cell.style, "Row")
+
+    def test_default_style_set_per_workbook(self):
+        wb1, wb2 = TemplatedWorkbook(), TemplatedWorkbook()
+        self.assertIsInstance(wb1.template_styles, DefaultStyleSet)
+        self.assertIsNot(wb1.template_styles, wb2.template_styles)
+
+        wb1.template_styles.extend(ExtendedStyle(base="Row", name="Row, bold", font={"bold": True}))
+        self.assertIn("Row, bold", wb1.template_styles)
+        self.assertNotIn("Row, bold", wb2.template_styles)
+        self.assertNotIn("Row, bold", default_style_set())
+
+        cell = wb1.workbook.active["A1"]
+        wb1.template_styles.style_cell(cell, "Row, bold")
+        self.assertTrue(cell.font.bold)
+
+    def test_copy(self):
+        copy = self.style_set.copy()
+        self.assertIsInstance(copy, DefaultStyleSet)
+        self.assertEqual(copy.names, self.style_set.names)
+
+        copy.extend(ExtendedStyle(base="Row", name="Row, bold", font={"bold": True}))
+        self.assertNotIn("Row, bold", self.style_set)
+
+
+class FrozenStyleSetTests(TestCase):
+    def setUp(self):
+        self.style_set = DefaultStyleSet().freeze()
+
+    def test_freeze(self):
+        self.assertIsInstance(self.style_set, FrozenStyleSet)
+        self.assertEqual(self.style_set.names, DefaultStyleSet().names)
+        self.assertIs(self.style_set.freeze(), self.style_set)
+
+        with self.assertRaises(TypeError):
+            self.style_set.extend(ExtendedStyle(base="Row", name="Row, bold", font={"bold": True}))
+
+    def test_shared_between_workbooks(self):
+        wb1, wb2 = Workbook(), Workbook()
+        wb1.add_named_style(DefaultStyleSet()["Title"])
+
+        for wb in (wb1, wb2):
+            cell = wb.active["A1"]
+            self.style_set.style_cell(cell, "Row, decimal")
+            self.assertEqual(cell.style, "Row, decimal")
+            self.assertEqual(cell.number_format, "0.00")
+
+        self.assertIsNot(wb1._named_styles["Row, decimal"], wb2._named_styles["Row, decimal"])
+        self.assertNotEqual(
+            self.style_set.style_array(wb1, "Row, decimal").xfId, self.style_set.style_array(wb2, "Row, decimal").xfId
+        )
+
+    def test_resolve_extended_style(self):
+        style = ExtendedStyle(base="Row", name="Row, bold", font={"bold": True})
+        named_style = self.style_set.resolve(style)
+
+        self.assertIs(self.style_set.resolve(style), named_style)
+        self.assertNotIn("Row, bold", self.style_set)
+
+        cell = Workbook().active["A1"]
+        self.style_set.style_cell(cell, style)
+        self.assertEqual(cell.style, "Row, bold")
+        self.assertTrue(cell.font.bold)
+
+    def test_resolve_styles_of_the_same_name(self):
+        bold = ExtendedStyle(base="Row", name="Row, emphasis", font={"bold": True})
+        italic = ExtendedStyle(base="Row", name="Row, emphasis", font={"italic": True})
+
+        self.assertTrue(self.style_set.resolve(bold).font.bold)
+        self.assertFalse(self.style_set.resolve(italic).font.bold)
+        self.assertTrue(self.style_set.resolve(italic).font.italic)
+
+        named_style = NamedStyle(name="Custom", font=Font(size=20))
+        self.assertIs(self.style_set.resolve(named_style), named_style)
+        self.assertEqual(self.style_set.resolve(NamedStyle(name="Custom", font=Font(size=8))).font.size, 8)
+
+    def test_copy(self):
+        copy = self.style_set.copy()
+        self.assertIs(type(copy), StyleSet)
+        self.assertEqual(copy.names, self.style_set.names)
+
+        copy.extend(ExtendedStyle(base="Row", name="Row, bold", font={"bold": True}))
+        self.assertIn("Row, bold", copy)
@@ -1,13 +1,15 @@
 from datetime import datetime
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
 from openpyxl import Workbook
 
 from openpyxl_templates import TemplatedWorkbook
+from openpyxl_templates.profiling import ColumnTimings
+from openpyxl_templates.styles import DefaultStyleSet
 from openpyxl_templates.table_sheet import TableSheet
 from openpyxl_templates.table_sheet.columns import TableColumn, ColumnIndexNotSet, BoolColumn, StringToLong, \
     CharColumn, UnableToParseBool, FloatColumn, BlankNotAllowed, UnableToParseFloat, IntColumn, RoundingRequired, \
-    ChoiceColumn, IllegalChoice, DatetimeColumn, UnableToParseDatetime
+    ChoiceColumn, IllegalChoice, DatetimeColumn, UnableToParseDatetime, RowStyle, numpy
 from openpyxl_templates.utils import FakeCell
 
 
@@ -357,6 +359,64 @@ class DatetimeColumnTestCase(TableColumnTests):
         ):
             self.assertFromExcel(excel, internal)
 
+    # Pinned from the implementation preceding the shared epoch helpers. Excel serial 60 is the non existent
+    # 1900-02-29, serials 1461 to 1463 and 1521 are the dates around the 1904 epoch.
+    SERIALS = (
+        (1, datetime(1900, 1, 1)),
+        (1.25, datetime(1900, 1, 1, 6)),
+        (58.5, datetime(1900, 2, 27, 12)),
+        (59, datetime(1900, 2, 28)),
+        (59.999988425925924, datetime(1900, 2, 28, 23, 59, 59)),
+        (60, datetime(1900, 3, 1)),
+        (60.25, datetime(1900, 3, 1, 6)),
+        (61, datetime(1900, 3, 1)),
+        (61.75, datetime(1900, 3, 1, 18)),
+        (1461, datetime(1903, 12, 31)),
+        (1462, datetime(1904, 1, 1)),
+        (1462.5, datetime(1904, 1, 1, 12)),
+        (1463, datetime(1904, 1, 2)),
+        (43006.628958333335, datetime(2017, 9, 28, 15, 5, 42)),
+        (2105636.2532348633, datetime(7665, 1, 11, 6, 4, 39, 492188)),
+    )
+    DATETIMES = (
+        (0.0, datetime(1899, 12, 31)),
+        (1.0, datetime(1900, 1, 1)),
+        (1.25, datetime(1900, 1, 1, 6)),
+        (59.99998842592593, datetime(1900, 2, 28, 23, 59, 59)),
+        (61.0, datetime(1900, 3, 1)),
+        (61.75, datetime(1900, 3, 1, 18)),
+        (1461.0, datetime(1903, 12, 31)),
+        (1462.0, datetime(1904, 1, 1)),
+        (1462.5, datetime(1904, 1, 1, 12)),
+        (1521.0, datetime(1904, 2, 29)),
+        (43006.628958333335, datetime(2017, 9, 28, 15, 5, 42, 123456)),
+    )
+
+    def test_leap_day_1900(self):
+        for excel, internal in self.SERIALS:
+            self.assertFromExcel(excel, internal)
+
+        for excel, internal in self.DATETIMES:
+            self.assertToExcel(excel, internal)
+
+        for excel in (0, 0.5):
+            with self.assertRaises(UnableToParseDatetime, msg=excel):
+                self.column._from_excel(FakeCell(excel))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_batch(self):
+        serials, datetimes = zip(*self.SERIALS)
+        self.assertEqual(
+            self.column.serials_to_datetime64(numpy.array(serials, dtype=float)).tolist(),
+            list(datetimes)
+        )
+
+        serials, datetimes = zip(*self.DATETIMES)
+        self.assertEqual(
+            self.column.datetime64_to_serials(numpy.array(datetimes, dtype="datetime64[us]")).tolist(),
+            list(serials)
+        )
+
     def test_unable_to_parse_datetime(self):
         for value in ("2017-09-28", -1, -1000.0, "adsf", False, object()):
             with self.assertRaises(UnableToParseDatetime, msg=value):
@@ -365,3 +425,91 @@ class DatetimeColumnTestCase(TableColumnTests):
             with self.assertRaises(UnableToParseDatetime, msg=value):
                 self.column._to_excel(value)
 
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class CompileEncoderTestCase(TestCase):
+    def setUp(self):
+        self.worksheet = Workbook().active
+        self.style_set = DefaultStyleSet()
+
+    def create_column(self, column_class=IntColumn, column_index=2, **kwargs):
+        column = column_class(header="y", object_attribute="y", **kwargs)
+        column.column_index = column_index
+        return column
+
+    def encode(self, column, obj, row_type=None, **kwargs):
+        get_value, create_cell, post_process_cell = column.compile_encoder(
+            self.worksheet, self.style_set, row_type=row_type if row_type is not None else type(obj), **kwargs
+        )
+        return create_cell(get_value(obj)), post_process_cell
+
+    def test_row_types(self):
+        column = self.create_column()
+        for obj in ((1, 2), [1, 2], {"x": 1, "y": 2}, Point(1, 2)):
+            cell, post_process_cell = self.encode(column, obj)
+            self.assertEqual(cell.value, 2)
+            self.assertEqual(cell.style, "Row, integer")
+            self.assertIsNone(post_process_cell)
+
+    def test_default(self):
+        cell, post_process_cell = self.encode(self.create_column(default=7), Point(1, None))
+        self.assertEqual(cell.value, 7)
+
+    def test_getter(self):
+        column = self.create_column(getter=lambda column, obj: obj.x * 10)
+        self.assertEqual(self.encode(column, Point(1, 2))[0].value, 10)
+
+    def test_row_style(self):
+        column = self.create_column()
+        column.add_row_style(RowStyle(row_type=list, getter=lambda column, obj: obj[0], cell_style="Row, decimal"))
+
+        cell = self.encode(column, [1, 2])[0]
+        self.assertEqual((cell.value, cell.style), (1, "Row, decimal"))
+        cell = self.encode(column, (1, 2))[0]
+        self.assertEqual((cell.value, cell.style), (2, "Row, integer"))
+
+    def test_overridden_get_value_from_object(self):
+        class SumColumn(IntColumn):
+            def get_value_from_object(self, obj, row_type=None):
+                return obj.x + obj.y
+
+        self.assertEqual(self.encode(self.create_column(SumColumn), Point(1, 2))[0].value, 3)
+
+    def test_overridden_create_cell_and_post_process_cell(self):
+        processed = []
+
+        class CustomColumn(IntColumn):
+            def create_cell(self, worksheet, style_set, value=None, row_type=None):
+                cell = super(CustomColumn, self).create_cell(worksheet, style_set, value, row_type=row_type)
+                cell.value *= 100
+                return cell
+
+            def post_process_cell(self, worksheet, style_set, cell, row_type=None):
+                processed.append((cell.value, row_type))
+
+        cell, post_process_cell = self.encode(self.create_column(CustomColumn), (1, 2))
+        self.assertEqual(cell.value, 200)
+        post_process_cell(cell)
+        self.assertEqual(processed, [(200, tuple)])
+
+    def test_encoded(self):
+        # Encoded rows hold values already converted by encode_batch, taken by position.
+        column = self.create_column(FloatColumn)
+        cell = self.encode(column, (1, "kept"), encoded=True)[0]
+        self.assertEqual(cell.value, "kept")
+        self.assertEqual(cell.style, "Row, decimal")
+
+    def test_timed(self):
+        timings = ColumnTimings()
+        column = self.create_column()
+        cell = self.encode(column, (1, 2), timings=timings)[0]
+        self.assertEqual((cell.value, cell.style), (2, "Row, integer"))
+        self.assertEqual(set(timings), {"to_excel", "style_cell"})
+
+        with self.assertRaises(BlankNotAllowed):
+            self.encode(self.create_column(TableColumn, allow_blank=False), (1, None), timings=timings)
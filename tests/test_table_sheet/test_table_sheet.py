@@ -1,10 +1,22 @@
-from unittest import TestCase
-
-from openpyxl_templates.table_sheet.columns import TableColumn
+from datetime import date, datetime
+from os import remove
+from tempfile import NamedTemporaryFile
+from unittest import TestCase, skipIf
+from zipfile import ZipFile
+
+from openpyxl.formatting.rule import Rule
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.styles import Font
+from openpyxl.styles.differential import DifferentialStyle
+
+from openpyxl_templates.table_sheet.columns import TableColumn, BlankNotAllowed, BoolColumn, RowStyle, CharColumn, \
+    IntColumn, FloatColumn, DatetimeColumn, DateColumn, UnableToParseInt, FormulaColumn, numpy
+from openpyxl_templates.exceptions import CellExceptions, RowExceptions
 from openpyxl_templates.table_sheet.table_sheet import TableSheet, ColumnHeadersNotUnique, NoTableColumns, \
-    CannotHideOrGroupLastColumn, HeadersNotFound, MultipleFrozenColumns
+    CannotHideOrGroupLastColumn, HeadersNotFound, MultipleFrozenColumns, CannotPreserveWriteOnlySheet, \
+    TableSheetExceptionPolicy, ColumnLengthsDiffer, HeaderMatching, ColumnNotFound, ColumnNotInMapping
 from openpyxl_templates.templated_workbook import TemplatedWorkbook
-from openpyxl_templates.utils import FakeCells
+from openpyxl_templates.utils import FakeCells, coalesce_ranges
 
 
 class TestTemplatedSheet(TableSheet):
@@ -75,6 +87,42 @@ class TemplatedSheetTestCase(TestCase):
         self.assertEqual(self.sheet.column2.column_index, 2)
         self.assertEqual(self.sheet.column3.column_index, 3)
 
+    def test_layout(self):
+        layout = self.sheet.layout
+        self.assertIs(self.sheet.layout, layout)
+        self.assertEqual(self.sheet.headers, ("column1", "column2", "column3"))
+        self.assertEqual(
+            [(column_layout.index, column_layout.letter, column_layout.header) for column_layout in layout],
+            [(1, "A", "column1"), (2, "B", "column2"), (3, "C", "column3")]
+        )
+        self.assertEqual(layout.columns[1].data_range(2, 10), "B2:B10")
+
+        self.sheet.add_column(TableColumn(header="column4"))
+        self.assertIsNot(self.sheet.layout, layout)
+        self.assertEqual(self.sheet.headers[-1], "column4")
+        self.assertEqual(self.sheet.layout.excess_start, "E")
+
+    def test_schema_shared_between_instances(self):
+        class SchemaSheet(TestTemplatedSheet):
+            row_styles = [RowStyle(row_type=list, cell_style="Row, integer")]
+
+        class SchemaSubSheet(SchemaSheet):
+            column4 = TableColumn(header="column4")
+
+        first, second = SchemaSheet(), SchemaSheet()
+        self.assertIs(first.row_class, second.row_class)
+        self.assertIs(first.layout, second.layout)
+        self.assertEqual(second.columns, first.columns)
+        self.assertEqual(len(SchemaSheet.row_styles), 1)
+        self.assertEqual(len(second.row_styles), 1)
+
+        second.add_column(TableColumn(header="column4"))
+        self.assertEqual(len(SchemaSheet().columns), 3)
+
+        self.assertEqual(SchemaSubSheet().headers, ("column1", "column2", "column3", "column4"))
+        self.assertEqual(SchemaSheet(columns=[TableColumn(header="column4")]).headers[-1], "column4")
+        self.assertEqual(SchemaSheet().headers, ("column1", "column2", "column3"))
+
     def test_no_table_columns_exeption(self):
         class NoColumnsTableSheet(TableSheet):
             pass
@@ -111,6 +159,21 @@ class TemplatedSheetTestCase(TestCase):
         self.assertEqual(obj.column2, "2")
         self.assertEqual(obj.column3, "3")
 
+    def test_read_short_row(self):
+        obj = self.sheet.object_from_values(("1",), row_number=3)
+        self.assertEqual(tuple(obj), ("1", None, None))
+
+    def test_create_object(self):
+        class CreateObjectSheet(TestTemplatedSheet):
+            def create_object(self, row_number, **data):
+                return row_number, data
+
+        sheet = CreateObjectSheet(sheetname="create_object")
+        self.assertEqual(
+            sheet.object_from_values(("1", "2", "3"), row_number=3),
+            (3, {"column1": "1", "column2": "2", "column3": "3"})
+        )
+
     def test_find_headers_and_read(self):
         sheet = FakeTableSheet(
             ("column1", "column2", "column3"),
@@ -137,6 +200,132 @@ class TemplatedSheetTestCase(TestCase):
                 sheet = FakeTableSheet(rows)
                 sheet.read()
 
+    def test_header_scan_limit(self):
+        rows = (("title",), ("description",), ("column1", "column2", "column3"), ("1", "2", "3"))
+
+        sheet = FakeTableSheet(*rows)
+        sheet.header_scan_limit = 3
+        self.assertEqual(tuple(tuple(row) for row in sheet.read()), (("1", "2", "3"),))
+
+        sheet = FakeTableSheet(*rows)
+        sheet.header_scan_limit = 2
+        with self.assertRaises(HeadersNotFound):
+            sheet.read()
+
+    def test_reordered_headers(self):
+        rows = (("title",), (None, "column3", "other", "column1", "column2"), (None, "3", "x", "1", "2"))
+
+        sheet = FakeTableSheet(*rows)
+        with self.assertRaises(HeadersNotFound):
+            sheet.read()
+
+        sheet = FakeTableSheet(*rows)
+        sheet.header_matching = HeaderMatching.Reordered
+        self.assertEqual(tuple(tuple(row) for row in sheet.read()), (("1", "2", "3"),))
+
+    def test_fuzzy_headers(self):
+        rows = (("Column 2", " COLUMN1", "colum3"), ("2", "1", "3"), ("5", "4"))
+
+        sheet = FakeTableSheet(*rows)
+        sheet.header_matching = HeaderMatching.Reordered
+        with self.assertRaises(HeadersNotFound):
+            sheet.read()
+
+        sheet = FakeTableSheet(*rows)
+        sheet.header_matching = HeaderMatching.Fuzzy
+        self.assertEqual(tuple(tuple(row) for row in sheet.read()), (("1", "2", "3"), ("4", "5", None)))
+
+    def test_reordered_columns_of_worksheet(self):
+        class WideSheet(TableSheet):
+            column1 = TableColumn(header="column1")
+            column2 = TableColumn(header="column2")
+            column3 = TableColumn(header="column3")
+
+        class WideWorkbook(TemplatedWorkbook):
+            sheet1 = WideSheet(header_matching=HeaderMatching.Reordered)
+
+        headers = ["other%d" % index for index in range(10)]
+        headers[7], headers[2], headers[5] = "column1", "column2", "column3"
+
+        wb = WideWorkbook()
+        worksheet = wb.sheet1.worksheet
+        worksheet.append(("Title",))
+        worksheet.append(headers)
+        worksheet.append(["%s row1" % header for header in headers])
+        worksheet.append(["%s row2" % header for header in headers[:6]])
+
+        file = NamedTemporaryFile(suffix=".xlsx", delete=False)
+        file.close()
+        try:
+            wb.save(file.name)
+            for read_only in (False, True):
+                wb = WideWorkbook(file.name, read_only=read_only)
+                self.assertEqual(
+                    [tuple(row) for row in wb.sheet1.read()],
+                    [("column1 row1", "column2 row1", "column3 row1"), (None, "column2 row2", "column3 row2")]
+                )
+                self.assertEqual(list(wb.sheet1.column_positions().values()), [8, 3, 6])
+        finally:
+            remove(file.name)
+
+    def test_read_projection(self):
+        wb = TestTemplatedWorkbook()
+        wb.sheet1.write(data, title="Title")
+
+        rows = list(wb.sheet1.read(columns=("column3", wb.sheet1.column1)))
+        self.assertEqual(rows, [(row[2], row[0]) for row in data])
+        self.assertEqual(rows[0]._fields, ("column3", "column1"))
+        self.assertEqual(rows[0].column1, "Col1Row1")
+
+        rows = list(wb.sheet1.read(columns=("column2",), look_for_headers=False))
+        self.assertEqual([row.column2 for row in rows], [None, "column2"] + [row[1] for row in data])
+
+        with self.assertRaises(ColumnNotFound):
+            list(wb.sheet1.read(columns=("column4",)))
+
+    def test_read_projection_skips_columns(self):
+        class IntFakeTableSheet(FakeTableSheet):
+            column2 = IntColumn(header="column2")
+
+        sheet = IntFakeTableSheet(
+            ("column1", "column2", "column3"),
+            ("1", "invalid", "3"),
+        )
+        with self.assertRaises(UnableToParseInt):
+            sheet.read()
+
+        sheet = IntFakeTableSheet(
+            ("column1", "column2", "column3"),
+            ("1", "invalid", "3"),
+        )
+        self.assertEqual(tuple(tuple(row) for row in sheet.read(columns=("column1", "column3"))), (("1", "3"),))
+
+    def test_read_where(self):
+        class IntFakeTableSheet(FakeTableSheet):
+            column3 = IntColumn(header="column3")
+
+        rows = (
+            ("column1", "column2", "column3"),
+            ("keep", "1", "1"),
+            ("drop", "2", "invalid"),
+            ("keep", "3", "3"),
+        )
+
+        sheet = IntFakeTableSheet(*rows)
+        self.assertEqual(
+            tuple(tuple(row) for row in sheet.read(where={"column1": "keep"})),
+            (("keep", "1", 1), ("keep", "3", 3))
+        )
+
+        sheet = IntFakeTableSheet(*rows)
+        self.assertEqual(
+            tuple(tuple(row) for row in sheet.read(
+                columns=("column2",),
+                where={sheet.column1: lambda value: value.startswith("k"), "column2": lambda value: value != "1"}
+            )),
+            (("3",),)
+        )
+
     def test_no_rows(self):
         sheet = FakeTableSheet(
             (
@@ -179,6 +368,124 @@ class TemplatedSheetTestCase(TestCase):
         result = tuple(tuple(row) for row in wb.sheet1.read())
         self.assertEqual(data[1:], result)
 
+    def test_coalesce_ranges(self):
+        self.assertEqual(
+            coalesce_ranges(((7, 7), (2, 3), (4, 5), (9, 12), (10, 11))),
+            [(2, 5), (7, 7), (9, 12)]
+        )
+
+    def test_data_validation_and_conditional_formatting_ranges(self):
+        bold = Rule(type="expression", dxf=DifferentialStyle(font=Font(bold=True)), formula=["$A2"])
+        italic = Rule(type="expression", dxf=DifferentialStyle(font=Font(italic=True)), formula=["$A2"])
+
+        class RangeSheet(TableSheet):
+            column1 = BoolColumn(header="column1", conditional_formatting=bold)
+            column2 = TableColumn(header="column2")
+
+            row_styles = [RowStyle(row_type=list, conditional_formatting=italic)]
+
+        class RangeWorkbook(TemplatedWorkbook):
+            sheet1 = RangeSheet()
+
+        wb = RangeWorkbook()
+        wb.sheet1.write(objects=((True, 1), (False, 2), [True, 3], (False, 4), (True, 5)))
+        worksheet = wb.sheet1.worksheet
+
+        self.assertEqual(len(worksheet.data_validations.dataValidation), 1)
+        self.assertEqual(worksheet.data_validations.dataValidation[0].sqref, "A2:A6")
+        self.assertEqual(
+            {
+                range_string: [rule.dxf.font.italic for rule in rules]
+                for range_string, rules in worksheet.conditional_formatting.cf_rules.items()
+            },
+            {"A2:A3 A5:A6": [False], "A4": [True], "B4": [True]}
+        )
+
+    def test_append_extends_ranges(self):
+        bold = Rule(type="expression", dxf=DifferentialStyle(font=Font(bold=True)), formula=["$A2"])
+        italic = Rule(type="expression", dxf=DifferentialStyle(font=Font(italic=True)), formula=["$A2"])
+
+        class RangeSheet(TableSheet):
+            column1 = BoolColumn(header="column1", conditional_formatting=bold)
+            column2 = TableColumn(header="column2")
+
+            row_styles = [RowStyle(row_type=list, conditional_formatting=italic)]
+
+        class RangeWorkbook(TemplatedWorkbook):
+            sheet1 = RangeSheet()
+
+        wb = RangeWorkbook()
+        wb.sheet1.write(objects=((True, 1), (False, 2), [True, 3]), title="Title")
+
+        file = NamedTemporaryFile(suffix=".xlsx", delete=False)
+        file.close()
+        try:
+            wb.save(file.name)
+            wb = RangeWorkbook(file.name)
+        finally:
+            remove(file.name)
+
+        wb.sheet1.write(objects=((True, 4), [False, 5], [True, 6]), preserve=True)
+        worksheet = wb.sheet1.worksheet
+
+        self.assertEqual([table.ref for table in worksheet._tables], ["A2:B8"])
+        self.assertEqual([dv.sqref for dv in worksheet.data_validations.dataValidation], ["A3:A8"])
+        self.assertEqual(
+            {
+                range_string: [rule.dxf.font.italic for rule in rules]
+                for range_string, rules in worksheet.conditional_formatting.cf_rules.items()
+            },
+            {"A3:A4 A6": [False], "A5 A7:A8": [True], "B5 B7:B8": [True]}
+        )
+        self.assertEqual(worksheet["A1"].value, "Title")
+        self.assertEqual(
+            [tuple(row) for row in wb.sheet1.read()],
+            [(True, 1), (False, 2), (True, 3), (True, 4), (False, 5), (True, 6)]
+        )
+
+    def test_append_reordered_headers(self):
+        bold = Rule(type="expression", dxf=DifferentialStyle(font=Font(bold=True)), formula=["$A2"])
+
+        class RangeSheet(TableSheet):
+            column1 = BoolColumn(header="column1", conditional_formatting=bold)
+            column2 = TableColumn(header="column2")
+
+        class ReorderedSheet(TableSheet):
+            column2 = TableColumn(header="column2")
+            column1 = BoolColumn(header="column1", conditional_formatting=bold)
+
+        class RangeWorkbook(TemplatedWorkbook):
+            sheet1 = RangeSheet()
+
+        class ReorderedWorkbook(TemplatedWorkbook):
+            sheet1 = ReorderedSheet(header_matching=HeaderMatching.Reordered)
+
+        wb = RangeWorkbook()
+        wb.sheet1.write(objects=((True, 1), (False, 2)))
+
+        file = NamedTemporaryFile(suffix=".xlsx", delete=False)
+        file.close()
+        try:
+            wb.save(file.name)
+            wb = ReorderedWorkbook(file.name)
+        finally:
+            remove(file.name)
+
+        wb.sheet1.write(objects=((3, True), (4, False)), preserve=True)
+        worksheet = wb.sheet1.worksheet
+
+        self.assertEqual(
+            [tuple(cell.value for cell in row) for row in worksheet.iter_rows(min_row=4, max_row=5)],
+            [(True, 3), (False, 4)]
+        )
+        self.assertEqual([table.ref for table in worksheet._tables], ["A1:B5"])
+        self.assertEqual([dv.sqref for dv in worksheet.data_validations.dataValidation], ["A2:A5"])
+        self.assertEqual(list(worksheet.conditional_formatting.cf_rules), ["A2:A5"])
+        self.assertEqual(
+            [tuple(row) for row in wb.sheet1.read()],
+            [(1, True), (2, False), (3, True), (4, False)]
+        )
+
     def test_no_freeze_pane(self):
         class NotFrozenWorkbook(TemplatedWorkbook):
             sheet1 = TestTemplatedSheet(freeze_header=False)
@@ -235,3 +542,480 @@ class TemplatedSheetTestCase(TestCase):
         for sheet, cell in ((wb.sheet1, "B2"), (wb.sheet2, "C2"), (wb.sheet3, "D2")):
             sheet.write(data)
             self.assertEqual(cell, sheet.worksheet.freeze_panes)
+
+
+class WriteOnlyTestCase(TestCase):
+    def setUp(self):
+        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            self.filename = f.name
+
+    def tearDown(self):
+        remove(self.filename)
+
+    def test_write_read(self):
+        wb = TestTemplatedWorkbook(write_only=True)
+        wb.sheet1.write(objects=(row for row in data), title="Title")
+        wb.save(self.filename)
+
+        wb = TestTemplatedWorkbook(file=self.filename)
+        self.assertEqual(data, tuple(tuple(row) for row in wb.sheet1.read()))
+
+    def test_worksheet_finalized(self):
+        wb = TestTemplatedWorkbook(write_only=True)
+        wb.sheet1.write(objects=data)
+        wb.save(self.filename)
+
+        worksheet = TestTemplatedWorkbook(file=self.filename).sheet1.worksheet
+        self.assertEqual(worksheet.freeze_panes, "A2")
+        self.assertEqual(worksheet.column_dimensions["A"].width, TestTemplatedSheet.column1.width)
+        self.assertEqual(worksheet.auto_filter.ref, "A1:C4")
+
+    def test_conditional_formatting_and_print_titles(self):
+        bold = Rule(type="expression", dxf=DifferentialStyle(font=Font(bold=True)), formula=["$A2"])
+        validation = DataValidation(type="list", formula1='"x,y"')
+
+        class FormattedSheet(TableSheet):
+            column1 = TableColumn(header="column1", conditional_formatting=bold, data_validation=validation)
+            column2 = TableColumn(header="column2")
+
+        class FormattedWorkbook(TemplatedWorkbook):
+            sheet1 = FormattedSheet()
+
+        wb = FormattedWorkbook(write_only=True)
+        wb.sheet1.write(objects=(("x", 1), ("y", 2)), title="Title")
+        wb.save(self.filename)
+
+        with ZipFile(self.filename) as archive:
+            sheet_xml = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+            workbook_xml = archive.read("xl/workbook.xml").decode("utf-8")
+        self.assertIn('<conditionalFormatting sqref="A3:A4">', sheet_xml)
+        self.assertLess(sheet_xml.index("<conditionalFormatting"), sheet_xml.index("<dataValidations"))
+        self.assertIn("_xlnm.Print_Titles", workbook_xml)
+
+        worksheet = FormattedWorkbook(file=self.filename).sheet1.worksheet
+        rules = worksheet.conditional_formatting.cf_rules
+        self.assertEqual(list(rules), ["A3:A4"])
+        self.assertTrue(list(rules.values())[0][0].dxf.font.bold)
+        self.assertEqual(worksheet.print_title_rows, "1:2")
+
+    def test_cannot_preserve(self):
+        wb = TestTemplatedWorkbook(write_only=True)
+        wb.sheet1.write(objects=data)
+
+        with self.assertRaises(CannotPreserveWriteOnlySheet):
+            wb.sheet1.write(objects=data, preserve=True)
+
+
+class ReadOnlyTestCase(TestCase):
+    def setUp(self):
+        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            self.filename = f.name
+
+        wb = TestTemplatedWorkbook()
+        wb.sheet1.write(objects=data + ((None, None, "Col3Row4"),), title="Title", description="Description")
+        wb.save(self.filename)
+
+    def tearDown(self):
+        remove(self.filename)
+
+    def test_read(self):
+        wb = TestTemplatedWorkbook(file=self.filename, read_only=True)
+        self.assertFalse(wb.sheet1.empty)
+        self.assertEqual(
+            data + ((None, None, "Col3Row4"),),
+            tuple(tuple(row) for row in wb.sheet1.read())
+        )
+
+    def test_cell_exception_coordinate(self):
+        class NotBlankSheet(TableSheet):
+            column1 = TableColumn(header="column1", allow_blank=False)
+            column2 = TableColumn(header="column2")
+            column3 = TableColumn(header="column3")
+
+        class NotBlankWorkbook(TemplatedWorkbook):
+            sheet1 = NotBlankSheet()
+
+        wb = NotBlankWorkbook(file=self.filename, read_only=True)
+        with self.assertRaisesRegex(BlankNotAllowed, "A7"):
+            tuple(wb.sheet1.read())
+
+
+class NotBlankSheet(TableSheet):
+    column1 = TableColumn(header="column1", allow_blank=False)
+    column2 = TableColumn(header="column2", allow_blank=False)
+    column3 = TableColumn(header="column3")
+
+
+class NotBlankWorkbook(TemplatedWorkbook):
+    sheet1 = NotBlankSheet()
+
+
+class ReadParallelTestCase(TestCase):
+    rows = tuple(
+        ("Col1Row%d" % i, "Col2Row%d" % i if i % 4 else None, "Col3Row%d" % i)
+        for i in range(1, 11)
+    )
+    valid_rows = tuple(row for row in rows if row[1] is not None)
+
+    def setUp(self):
+        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            self.filename = f.name
+
+        wb = TestTemplatedWorkbook()
+        wb.sheet1.write(objects=self.rows, title="Title")
+        wb.save(self.filename)
+
+        self.wb = NotBlankWorkbook(file=self.filename, read_only=True)
+
+    def tearDown(self):
+        remove(self.filename)
+
+    def read_parallel(self, exception_policy):
+        return self.wb.sheet1.read_parallel(workers=2, chunk_size=3, exception_policy=exception_policy)
+
+    def test_read_parallel(self):
+        wb = TestTemplatedWorkbook(file=self.filename, read_only=True)
+        self.assertEqual(self.rows, tuple(tuple(row) for row in wb.sheet1.read_parallel(workers=2, chunk_size=3)))
+
+    def test_raise_cell_exception(self):
+        rows = []
+        with self.assertRaisesRegex(BlankNotAllowed, "B6"):
+            for row in self.read_parallel(TableSheetExceptionPolicy.RaiseCellException):
+                rows.append(tuple(row))
+        self.assertEqual(self.valid_rows[:3], tuple(rows))
+
+    def test_raise_row_exception(self):
+        with self.assertRaises(CellExceptions) as context:
+            tuple(self.read_parallel(TableSheetExceptionPolicy.RaiseRowException))
+        self.assertEqual(context.exception.row_number, 6)
+        self.assertEqual([e.coordinate for e in context.exception.cell_exceptions], ["B6"])
+
+    def test_raise_sheet_exception(self):
+        rows = []
+        with self.assertRaises(RowExceptions) as context:
+            for row in self.read_parallel(TableSheetExceptionPolicy.RaiseSheetException):
+                rows.append(tuple(row))
+        self.assertEqual(self.valid_rows, tuple(rows))
+        self.assertEqual([e.row_number for e in context.exception.exceptions], [6, 10])
+
+    def test_ignore_row(self):
+        self.assertEqual(
+            self.valid_rows,
+            tuple(tuple(row) for row in self.read_parallel(TableSheetExceptionPolicy.IgnoreRow))
+        )
+
+    def test_same_as_read(self):
+        for exception_policy in TableSheetExceptionPolicy:
+            try:
+                expected = tuple(self.wb.sheet1.read(exception_policy=exception_policy))
+            except Exception as e:
+                with self.assertRaises(type(e)):
+                    tuple(self.read_parallel(exception_policy))
+            else:
+                self.assertEqual(expected, tuple(self.read_parallel(exception_policy)))
+
+
+class ColumnsFakeTableSheet(TableSheet):
+    char = CharColumn(header="char")
+    integer = IntColumn(header="integer", allow_blank=False)
+    float = FloatColumn(header="float", default=None)
+    boolean = BoolColumn(header="boolean")
+    datetime = DatetimeColumn(header="datetime")
+    date = DateColumn(header="date")
+
+    def __init__(self, *rows):
+        self.fake_worksheet = (FakeCells(*row) for row in rows)
+
+        super(ColumnsFakeTableSheet, self).__init__(sheetname="fakesheet")
+
+    @property
+    def worksheet(self):
+        return self.fake_worksheet
+
+
+class ReorderedCoordinatesTestCase(TestCase):
+    def setUp(self):
+        class IntegerSheet(TableSheet):
+            char = CharColumn(header="char")
+            integer = IntColumn(header="integer")
+
+        class IntegerWorkbook(TemplatedWorkbook):
+            sheet1 = IntegerSheet(header_matching=HeaderMatching.Reordered)
+
+        self.wb = IntegerWorkbook()
+        worksheet = self.wb.sheet1.worksheet
+        for row in (("other", "char", None, "integer"), (None, "a", None, 1), (None, "b", None, "x")):
+            worksheet.append(row)
+
+    def test_read(self):
+        with self.assertRaisesRegex(UnableToParseInt, "D3") as context:
+            list(self.wb.sheet1.read())
+        self.assertEqual(context.exception.coordinate, "D3")
+
+        with self.assertRaises(RowExceptions) as context:
+            list(self.wb.sheet1.read(exception_policy=TableSheetExceptionPolicy.RaiseSheetException))
+        self.assertEqual(
+            [e.coordinate for row_exception in context.exception.exceptions for e in row_exception.cell_exceptions],
+            ["D3"]
+        )
+
+    def test_read_columns(self):
+        with self.assertRaisesRegex(UnableToParseInt, "D3") as context:
+            self.wb.sheet1.read_columns()
+        self.assertEqual(context.exception.coordinate, "D3")
+
+    def test_read_parallel(self):
+        with self.assertRaises(UnableToParseInt) as context:
+            list(self.wb.sheet1.read_parallel(workers=2, chunk_size=1))
+        self.assertEqual(context.exception.coordinate, "D3")
+
+
+class ReadColumnsTestCase(TestCase):
+    headers = ("char", "integer", "float", "boolean", "datetime", "date")
+    rows = (
+        ("a", 1, 1.5, True, datetime(2017, 1, 1, 12), datetime(2017, 1, 1)),
+        ("b", 2.0, None, False, datetime(2017, 1, 2, 12), datetime(2017, 1, 2)),
+        ("c", "x", 3, True, datetime(2017, 1, 3, 12), datetime(2017, 1, 3)),
+        ("d", 4, 4.5, False, datetime(2017, 1, 4, 12), datetime(2017, 1, 4)),
+    )
+
+    def read_columns(self, rows, **kwargs):
+        sheet = ColumnsFakeTableSheet(self.headers, *rows)
+        return sheet.read_columns(batch_size=2, **kwargs)
+
+    def test_read_columns(self):
+        columns = self.read_columns(self.rows[:2] + self.rows[3:])
+        self.assertEqual(list(columns.keys()), list(self.headers))
+        self.assertEqual(list(columns["char"]), ["a", "b", "d"])
+        self.assertEqual(list(columns["integer"]), [1, 2, 4])
+        self.assertEqual(list(columns["boolean"]), [True, False, False])
+        self.assertEqual(list(columns["float"])[::2], [1.5, 4.5])
+        self.assertEqual(len(columns["date"]), 3)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_dtypes(self):
+        columns = self.read_columns(self.rows[:2] + self.rows[3:])
+        self.assertEqual(
+            [str(values.dtype) for values in columns.values()],
+            ["object", "int64", "float64", "bool", "datetime64[us]", "datetime64[D]"]
+        )
+        self.assertTrue(numpy.isnan(columns["float"][1]))
+        self.assertEqual(columns["datetime"][0], numpy.datetime64("2017-01-01T12:00"))
+        self.assertEqual(columns["date"][2], numpy.datetime64("2017-01-04"))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_blanks_decoded_in_one_pass(self):
+        decode_batch = CharColumn(header="char").compile_batch_decoder()
+        array = decode_batch(["a", None, "b", ""])
+        self.assertIsNotNone(array)
+        self.assertEqual(array.dtype, object)
+        self.assertEqual(list(array), ["a", None, "b", None])
+
+        array = BoolColumn(header="boolean").compile_batch_decoder()([True, None])
+        self.assertEqual(array.dtype, object)
+        self.assertEqual(list(array), [True, None])
+
+        columns = self.read_columns(((None, 1, 1.5, None, None, None),) + self.rows[:2])
+        self.assertEqual(list(columns["char"]), [None, "a", "b"])
+        self.assertEqual(list(columns["boolean"]), [None, True, False])
+
+    def test_raise_cell_exception(self):
+        with self.assertRaisesRegex(UnableToParseInt, "B4"):
+            self.read_columns(self.rows)
+
+    def test_raise_row_exception(self):
+        with self.assertRaises(CellExceptions) as context:
+            self.read_columns(self.rows, exception_policy=TableSheetExceptionPolicy.RaiseRowException)
+        self.assertEqual(context.exception.row_number, 4)
+
+    def test_raise_sheet_exception(self):
+        with self.assertRaises(RowExceptions) as context:
+            self.read_columns(
+                self.rows + (("e", None, 1, True, None, None),),
+                exception_policy=TableSheetExceptionPolicy.RaiseSheetException
+            )
+        self.assertEqual([e.row_number for e in context.exception.exceptions], [4, 6])
+
+    def test_ignore_row(self):
+        columns = self.read_columns(self.rows, exception_policy=TableSheetExceptionPolicy.IgnoreRow)
+        self.assertEqual(list(columns["char"]), ["a", "b", "d"])
+        self.assertEqual(list(columns["integer"]), [1, 2, 4])
+        self.assertEqual(list(columns["datetime"])[2], numpy.datetime64("2017-01-04T12:00") if numpy else
+                         datetime(2017, 1, 4, 12))
+
+    def test_no_rows(self):
+        columns = self.read_columns(())
+        self.assertEqual([len(values) for values in columns.values()], [0] * 6)
+
+
+class WriteColumnsSheet(TableSheet):
+    char = CharColumn(header="char")
+    integer = IntColumn(header="integer")
+    float = FloatColumn(header="float", default=None)
+    boolean = BoolColumn(header="boolean")
+    datetime = DatetimeColumn(header="datetime")
+    date = DateColumn(header="date")
+
+
+class WriteColumnsWorkbook(TemplatedWorkbook):
+    sheet1 = WriteColumnsSheet()
+
+
+class WriteColumnsTestCase(TestCase):
+    objects = (
+        ("a", 1, 1.5, True, datetime(1900, 2, 28, 12), date(1900, 2, 28)),
+        ("b", 2, None, False, datetime(1900, 3, 1, 6), date(1900, 3, 1)),
+        ("c", 3, 3.25, True, datetime(2017, 1, 3, 12), date(2017, 1, 3)),
+    )
+
+    def write(self, objects):
+        wb = WriteColumnsWorkbook()
+        wb.sheet1.write(objects=objects)
+        return [[cell.value for cell in row] for row in wb.sheet1.worksheet.iter_rows()]
+
+    def write_columns(self, columns, **kwargs):
+        wb = WriteColumnsWorkbook()
+        wb.sheet1.write_columns(columns, **kwargs)
+        return [[cell.value for cell in row] for row in wb.sheet1.worksheet.iter_rows()]
+
+    def test_write_columns(self):
+        columns = dict(zip(("char", "integer", "float", "boolean", "datetime", "date"), zip(*self.objects)))
+        self.assertEqual(self.write(self.objects), self.write_columns(columns))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_write_arrays(self):
+        columns = {
+            "char": numpy.array(["a", "b", "c"]),
+            "integer": numpy.array([1.0, 2.0, 3.0]),
+            "float": numpy.array([1.5, numpy.nan, 3.25]),
+            "boolean": numpy.array([True, False, True]),
+            "datetime": numpy.array(["1900-02-28T12:00", "1900-03-01T06:00", "2017-01-03T12:00"],
+                                    dtype="datetime64[ns]"),
+            "date": numpy.array(["1900-02-28", "1900-03-01", "2017-01-03"], dtype="datetime64[D]"),
+        }
+        self.assertEqual(self.write(self.objects), self.write_columns(columns))
+
+    def test_missing_column(self):
+        rows = self.write_columns({"char": ["a", "b"]})
+        self.assertEqual(rows[1:], [["a", 0, None, None, None, None], ["b", 0, None, None, None, None]])
+
+    def test_missing_column_default(self):
+        class DefaultSheet(TableSheet):
+            char = CharColumn(header="char")
+            decimal = FloatColumn(header="decimal", default=1.5)
+
+        class DefaultWorkbook(TemplatedWorkbook):
+            sheet1 = DefaultSheet()
+
+        wb = DefaultWorkbook()
+        wb.sheet1.write_columns({"char": ["a", "b"]})
+        self.assertEqual([(row.char, row.decimal) for row in wb.sheet1.read()], [("a", 1.5), ("b", 1.5)])
+
+    def test_encode_blanks(self):
+        self.assertEqual(FloatColumn(header="float").encode_batch([1.5, float("nan"), None]), [1.5, 0.0, 0.0])
+        self.assertEqual(CharColumn(header="char").encode_batch(["a", float("nan"), None]), ["a", None, None])
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_encode_blank_arrays(self):
+        # Object arrays are not converted in one pass, NaN and NaT are blank on either path.
+        self.assertEqual(
+            FloatColumn(header="float").encode_batch(numpy.array([1.5, numpy.nan, None], dtype=object)),
+            [1.5, 0.0, 0.0]
+        )
+        self.assertEqual(FloatColumn(header="float").encode_batch(numpy.array([1.5, numpy.nan])), [1.5, 0.0])
+        self.assertEqual(
+            CharColumn(header="char").encode_batch(numpy.array(["a", numpy.nan, None], dtype=object)),
+            ["a", None, None]
+        )
+        self.assertEqual(
+            DatetimeColumn(header="datetime").encode_batch(
+                numpy.array([numpy.datetime64("NaT"), None], dtype=object)
+            ),
+            [None, None]
+        )
+
+    def write_both(self, sheet_class, objects, columns):
+        class BothWorkbook(TemplatedWorkbook):
+            sheet1 = sheet_class()
+
+        written = []
+        for write in (lambda sheet: sheet.write(objects=objects), lambda sheet: sheet.write_columns(columns)):
+            wb = BothWorkbook()
+            write(wb.sheet1)
+            written.append([[cell.value for cell in row] for row in wb.sheet1.worksheet.iter_rows()])
+        return written
+
+    def test_blank_strings(self):
+        class RequiredSheet(TableSheet):
+            name = CharColumn(header="name", allow_blank=False)
+
+        class DefaultSheet(TableSheet):
+            name = CharColumn(header="name", default="x")
+
+        class RequiredWorkbook(TemplatedWorkbook):
+            sheet1 = RequiredSheet()
+
+        names = [["a", ""]]
+        if numpy is not None:
+            names.append(numpy.array(["a", ""]))
+        for values in names:
+            with self.assertRaises(BlankNotAllowed):
+                RequiredWorkbook().sheet1.write(objects=[(value,) for value in values])
+            with self.assertRaises(BlankNotAllowed):
+                RequiredWorkbook().sheet1.write_columns({"name": values})
+
+            written, written_columns = self.write_both(DefaultSheet, [(value,) for value in values], {"name": values})
+            self.assertEqual(written, written_columns)
+            self.assertEqual(written[1:], [["a"], ["x"]])
+
+    def test_missing_formula_column(self):
+        class FormulaSheet(TableSheet):
+            value = IntColumn(header="value")
+            double = FormulaColumn(header="double", formula="=A2*2")
+            empty = TableColumn(header="empty")
+
+        written, written_columns = self.write_both(FormulaSheet, [(1, None, None)], {"value": [1]})
+        self.assertEqual(written, written_columns)
+        self.assertEqual(written[1], [1, "=A2*2", None])
+
+    def test_missing_getter_column(self):
+        class GetterSheet(TableSheet):
+            value = IntColumn(header="value")
+            double = IntColumn(header="double", getter=lambda column, obj: obj[0] * 2)
+
+        class GetterWorkbook(TemplatedWorkbook):
+            sheet1 = GetterSheet()
+
+        with self.assertRaises(ColumnNotInMapping):
+            GetterWorkbook().sheet1.write_columns({"value": [1]})
+
+        class ObjectColumn(IntColumn):
+            def get_value_from_object(self, obj, row_type=None):
+                raise AssertionError("The getter is not used for missing columns.")
+
+        class ObjectSheet(TableSheet):
+            value = IntColumn(header="value")
+            double = ObjectColumn(header="double")
+
+        class ObjectWorkbook(TemplatedWorkbook):
+            sheet1 = ObjectSheet()
+
+        with self.assertRaises(ColumnNotInMapping):
+            ObjectWorkbook().sheet1.write_columns({"value": [1]})
+
+        wb = GetterWorkbook()
+        wb.sheet1.write_columns({"value": [1], "double": [2]})
+        self.assertEqual([tuple(row) for row in wb.sheet1.read()], [(1, 2)])
+
+    def test_column_lengths_differ(self):
+        with self.assertRaises(ColumnLengthsDiffer):
+            self.write_columns({"char": ["a", "b"], "integer": [1]})
+
+    def test_preserve(self):
+        wb = WriteColumnsWorkbook()
+        wb.sheet1.write_columns({"char": ["a"], "integer": [1]})
+        wb.sheet1.write_columns({"char": ["b"], "integer": [2]}, preserve=True)
+        self.assertEqual(
+            [(row.char, row.integer) for row in wb.sheet1.read()],
+            [("a", 1), ("b", 2)]
+        )
@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from openpyxl_templates.utils import Typed
+
+
+class Settings(object):
+    width = Typed("width", expected_type=int, value=10)
+    label = Typed("label", expected_types=[str, bytes], allow_none=True)
+    flag = Typed("flag", expected_type=bool)
+
+
+class TypedTests(TestCase):
+    def setUp(self):
+        self.settings = Settings()
+
+    def test_default(self):
+        self.assertEqual(self.settings.width, 10)
+        self.assertIsNone(self.settings.label)
+        self.assertEqual(Settings.width, 10)
+        self.assertNotIn("width", vars(self.settings))
+
+    def test_set(self):
+        self.settings.width = 20
+        self.settings.label = b"label"
+        self.assertEqual(self.settings.width, 20)
+        self.assertEqual(self.settings.label, b"label")
+        self.assertEqual(vars(self.settings), {"width": 20, "label": b"label"})
+        self.assertEqual(Settings().width, 10)
+
+    def test_subclass_of_expected_type(self):
+        # bool is a subclass of int.
+        self.settings.width = True
+        self.assertIs(self.settings.width, True)
+
+    def test_none_resets_to_default(self):
+        self.settings.width = 20
+        self.settings.width = None
+        self.assertEqual(self.settings.width, 10)
+        self.assertNotIn("width", vars(self.settings))
+
+        self.settings.label = "label"
+        self.settings.label = None
+        self.assertIsNone(self.settings.label)
+
+    def test_none_not_allowed(self):
+        with self.assertRaisesRegex(ValueError, "flag"):
+            self.settings.flag = None
+
+    def test_type_error(self):
+        with self.assertRaisesRegex(TypeError, "width"):
+            self.settings.width = "20"
+        with self.assertRaises(TypeError):
+            self.settings.label = 1
+        self.assertEqual(self.settings.width, 10)
+
+    def test_invalid_default(self):
+        with self.assertRaises(TypeError):
+            Typed("width", expected_type=int, value="10")
+
+    def test_outside_class_body(self):
+        # Descriptors added after the class is created are not named by __set_name__ and use a key of their own.
+        typed = Typed("height", expected_type=int, value=1)
+        Settings.height = typed
+        try:
+            settings = Settings()
+            self.assertEqual(settings.height, 1)
+            settings.height = 2
+            self.assertEqual(settings.height, 2)
+            self.assertEqual(vars(settings), {"_typed_height": 2})
+            settings.height = None
+            self.assertEqual(settings.height, 1)
+        finally:
+            del Settings.height
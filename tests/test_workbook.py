@@ -1,7 +1,21 @@
+from io import BytesIO
+from os import remove
+from tempfile import NamedTemporaryFile
+from threading import enumerate as enumerate_threads
 from unittest import TestCase
 
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import Rule
+from openpyxl.styles import Font
+from openpyxl.styles.differential import DifferentialStyle
+
+from openpyxl_templates import writer
+from openpyxl_templates.parallel import _CELL_RE, _CELL_START
+from openpyxl_templates.profiling import Stats
 from openpyxl_templates.table_sheet import TableSheet, TableColumn
-from openpyxl_templates.templated_workbook import TemplatedWorkbook, SheetnamesNotUnique, MultipleActiveSheets
+from openpyxl_templates.templated_workbook import TemplatedWorkbook, SheetnamesNotUnique, MultipleActiveSheets, \
+    WriteOnlyWorkbookFromFile, ParallelWriteRequiresWriteOnly
 
 
 class TestTemplatedSheet(TableSheet):
@@ -103,7 +117,178 @@ class TemplatedWorkbookTests(TestCase):
         with self.assertRaises(MultipleActiveSheets):
             MultipleActiveWorkbook()
 
+    def test_write_only_from_file(self):
+        with self.assertRaises(WriteOnlyWorkbookFromFile):
+            TestTemplatedWorkbook(file="workbook.xlsx", write_only=True)
+
+    def test_write_parallel_requires_write_only(self):
+        with self.assertRaises(ParallelWriteRequiresWriteOnly):
+            self.wb.write_parallel({self.wb.sheet1: dict(objects=((1, 2, 3),))})
+
     # def test_asdf(self):
     #     self.wb.create_sheet("asdf")
     #     ws = self.wb["asdf"]
-    #     x = self.wb["asdf"].__iter__()
\ No newline at end of file
+    #     x = self.wb["asdf"].__iter__()
+
+class WriteParallelTests(TestCase):
+    def setUp(self):
+        with NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+            self.filename = f.name
+
+    def tearDown(self):
+        remove(self.filename)
+
+    def write_parallel(self, processes):
+        wb = TestTemplatedWorkbook(write_only=True)
+        wb.write_parallel({
+            wb.sheet2: dict(objects=lambda: (("a", 1, 2.5), ("b", 2, None))),
+            wb.sheet1: dict(objects=(("c", 3, "d"),), title="Title"),
+        }, processes=processes)
+        wb.save(self.filename)
+
+        return TestTemplatedWorkbook(file=self.filename)
+
+    def test_write_parallel(self):
+        wb = self.write_parallel(processes=2)
+        self.assertEqual(wb.sheetnames, ["Custom sheetname", "sheet2"])
+        self.assertEqual([tuple(row) for row in wb.sheet1.read()], [("c", 3, "d")])
+        self.assertEqual([tuple(row) for row in wb.sheet2.read()], [("a", 1, 2.5), ("b", 2, None)])
+        self.assertEqual(wb.sheet1.worksheet["A1"].style, "Title")
+        self.assertEqual(wb.sheet1.worksheet["A2"].style, "Header")
+        self.assertEqual(wb.sheet2.worksheet["A2"].style, "Row")
+
+    def test_write_serial(self):
+        wb = self.write_parallel(processes=1)
+        self.assertEqual([tuple(row) for row in wb.sheet2.read()], [("a", 1, 2.5), ("b", 2, None)])
+
+    def test_conditional_formatting_and_print_titles(self):
+        bold = Rule(type="expression", dxf=DifferentialStyle(font=Font(bold=True)), formula=["$A2"])
+
+        class FormattedSheet(TableSheet):
+            column1 = TableColumn(header="column1", conditional_formatting=bold)
+            column2 = TableColumn(header="column2")
+
+        class FormattedWorkbook(TemplatedWorkbook):
+            sheet1 = FormattedSheet()
+            sheet2 = FormattedSheet()
+
+        wb = FormattedWorkbook(write_only=True)
+        wb.write_parallel({
+            wb.sheet1: dict(objects=(("a", 1), ("b", 2)), title="Title"),
+            wb.sheet2: dict(objects=(("c", 3),)),
+        }, processes=2)
+        wb.save(self.filename)
+
+        wb = FormattedWorkbook(file=self.filename)
+        self.assertEqual(list(wb.sheet1.worksheet.conditional_formatting.cf_rules), ["A3:A4"])
+        self.assertEqual(list(wb.sheet2.worksheet.conditional_formatting.cf_rules), ["A2"])
+        self.assertEqual(wb.sheet1.worksheet.print_title_rows, "1:2")
+        self.assertEqual(wb.sheet2.worksheet.print_title_rows, "1:1")
+
+    def test_cell_markup(self):
+        # The workers' cells are remapped with _CELL_RE, which expects the attributes in the order r, s, t.
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        cell = WriteOnlyCell(worksheet, value="text")
+        cell.font = Font(bold=True)
+        worksheet.append((cell, 1, None, "=1+1"))
+        worksheet.close()
+        with open(worksheet.filename, "rb") as f:
+            data = f.read()
+
+        matches = list(_CELL_RE.finditer(data))
+        self.assertEqual(len(matches), data.count(_CELL_START))
+        self.assertEqual(matches[0].group("r", "t"), (b"A1", b"s"))
+        self.assertIsNotNone(matches[0].group("s"))
+
+
+class UnseekableStream(object):
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+class SaveToStreamTests(TestCase):
+    rows = [("row %d" % index, index, "x" * 10) for index in range(2000)]
+
+    def create_workbook(self, write_only):
+        wb = TestTemplatedWorkbook(write_only=write_only)
+        wb.sheet2.write(objects=self.rows, title="Title")
+        wb.sheet1.write(objects=self.rows[:1])
+        return wb
+
+    def assertWorkbook(self, content):
+        wb = TestTemplatedWorkbook(file=BytesIO(content))
+        self.assertEqual(wb.sheetnames[:2], ["Custom sheetname", "sheet2"])
+        self.assertEqual([tuple(row) for row in wb.sheet2.read()], self.rows)
+
+    def test_save_to_stream(self):
+        for write_only in (True, False):
+            stream = UnseekableStream()
+            self.create_workbook(write_only).save_to_stream(stream)
+            self.assertWorkbook(b"".join(stream.chunks))
+
+    def test_save_virtual_workbook(self):
+        self.assertWorkbook(self.create_workbook(write_only=True).save_virtual_workbook())
+
+    def test_iter_chunks(self):
+        chunks = list(self.create_workbook(write_only=True).iter_chunks(chunk_size=1024))
+        self.assertGreater(len(chunks), 1)
+        self.assertWorkbook(b"".join(chunks))
+
+    def test_iter_chunks_closed_early(self):
+        def writer_threads():
+            return [thread for thread in enumerate_threads() if thread.name == "openpyxl_templates.iter_chunks"]
+
+        for write_only in (True, False):
+            workbook = self.create_workbook(write_only).workbook
+            chunks = writer.iter_chunks(workbook, chunk_size=1024, max_chunks=1)
+            next(chunks)
+            self.assertEqual(len(writer_threads()), 1)
+            chunks.close()
+            self.assertEqual(writer_threads(), [])
+
+
+class StatsTests(TestCase):
+    rows = [("row %d" % index, index, "x") for index in range(100)]
+
+    def test_stats(self):
+        reported = []
+        stats = Stats(callback=reported.append)
+        wb = TestTemplatedWorkbook(stats=stats)
+        wb.sheet2.write(objects=self.rows, title="Title")
+        wb.sheet2.write(objects=self.rows[:10], preserve=True)
+        self.assertEqual(len(list(wb.sheet2.read())), 110)
+        wb.sheet2.read_columns()
+        wb.save_virtual_workbook()
+
+        self.assertEqual(reported, stats.timings)
+        self.assertEqual(
+            [(timings.operation, timings.sheetname, timings.rows) for timings in stats.timings],
+            [("write", "sheet2", 100), ("append", "sheet2", 10), ("read", "sheet2", 110),
+             ("read_columns", "sheet2", 110), ("save", None, 0)]
+        )
+
+        write = stats.timings[0]
+        self.assertEqual(
+            list(write.phases), ["prepare_worksheet", "write_headers", "write_rows", "post_process_worksheet"]
+        )
+        self.assertEqual(list(write.columns), ["column1", "column2", "column3"])
+        self.assertEqual(set(write.columns["column1"]), {"to_excel", "style_cell"})
+        self.assertGreater(write.rows_per_second, 0)
+
+        read = stats.timings[2]
+        self.assertEqual(list(read.phases), ["iter_rows", "decode"])
+        self.assertEqual(set(read.columns["column2"]), {"from_excel"})
+        self.assertEqual(list(stats.timings[-1].phases), ["serialize"])
+
+    def test_no_stats(self):
+        wb = TestTemplatedWorkbook()
+        wb.sheet1.write(objects=self.rows)
+        self.assertIsNone(wb.sheet1.stats)